@@ -6,10 +6,10 @@ Entry point for the Hyperliquid Market Making Bot.
 import sys
 import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from main import main
-
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Add src to path only when launched as a script, so importing this
+    # module does not reorder sys.path for everything imported afterwards
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+    
+    from main import main
+    main()
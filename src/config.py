@@ -1,25 +1,57 @@
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    _json_loads = json.loads
+
+_dotenv_loaded = False  # .env is read once per process
+
 class ConfigManager:
     """Manages configuration for the market making program."""
     
+    # Top-level sections exposed as '<section>_config' attributes
+    _SECTIONS = ('exchange', 'asset', 'fees', 'volatility', 'risk', 'trading', 'volume')
+    
+    # Exchange fields that must be non-empty once credentials are injected
+    _REQUIRED_EXCHANGE_FIELDS = ('api_wallet', 'api_wallet_private', 'main_wallet', 'name')
+    
+    # '__dict__' is only allocated if something (e.g. patch.object in the
+    # tests) sets an attribute outside the declared slots
+    __slots__ = (
+        'config_path', 'config', '_flat', '_stat_key',
+        'exchange_config', 'asset_config', 'fees_config', 'volatility_config',
+        'risk_config', 'trading_config', 'volume_config', '__dict__'
+    )
+    
     def __init__(self, config_path: str = "config.json"):
         """Initialize configuration manager.
         
         Args:
             config_path: Path to the JSON configuration file
         """
-        load_dotenv()  # Load environment variables from .env file
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv()  # Load environment variables from .env file
+            _dotenv_loaded = True
         self.config_path = config_path
+        self._flat: Dict[str, Any] = {}  # Dotted-path index, refreshed in place on reload
         self.config = self._load_config()
         
+    @classmethod
+    def reload_env(cls) -> None:
+        """Force the .env file to be re-read (e.g. from tests)."""
+        global _dotenv_loaded
+        load_dotenv()
+        _dotenv_loaded = True
+    
     def _validate_config(self, config: Dict[str, Any]) -> None:
-        required_exchange_fields = ['api_wallet', 'api_wallet_private', 'main_wallet', 'name']
         exchange = config.get('exchange', {})
-        missing = [f for f in required_exchange_fields if not exchange.get(f)]
+        missing = [f for f in self._REQUIRED_EXCHANGE_FIELDS if not exchange.get(f)]
         if missing:
             raise ValueError(f"Missing required exchange config fields: {', '.join(missing)}")
         if not config.get('asset', {}).get('symbol'):
@@ -28,59 +60,94 @@ class ConfigManager:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file and environment variables."""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                config = _json_loads(f.read())
             
             # Add environment variables to config using Hyperliquid's API wallet terminology
-            config['exchange']['api_wallet'] = os.getenv('HYPERLIQUID_API_WALLET')
-            config['exchange']['api_wallet_private'] = os.getenv('HYPERLIQUID_API_WALLET_PRIVATE')
-            config['exchange']['main_wallet'] = os.getenv('HYPERLIQUID_MAIN_WALLET')
+            env = os.environ
+            exchange = config['exchange']
+            exchange['api_wallet'] = env.get('HYPERLIQUID_API_WALLET')
+            exchange['api_wallet_private'] = env.get('HYPERLIQUID_API_WALLET_PRIVATE')
+            exchange['main_wallet'] = env.get('HYPERLIQUID_MAIN_WALLET')
             
             self._validate_config(config)
             
+            # Config is immutable after load, so index every dotted path once
+            self._flat.clear()
+            self._flatten('', config)
+            self._stat_key = (st.st_mtime_ns, st.st_size)
+            for section in self._SECTIONS:
+                setattr(self, f'{section}_config', config.get(section, {}))
+            
             return config
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file {self.config_path} not found")
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             raise ValueError(f"Invalid JSON in configuration file: {e}")
     
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        keys = key.split('.')
-        value = self.config
+    def maybe_reload(self) -> bool:
+        """Reload configuration if the file's mtime or size changed.
+        
+        Returns:
+            True if the configuration was re-parsed, False if unchanged
+        """
+        st = os.stat(self.config_path)
+        if (st.st_mtime_ns, st.st_size) == self._stat_key:
+            return False
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        self.config = self._load_config()
+        return True
+    
+    def _flatten(self, prefix: str, node: Dict[str, Any]) -> None:
+        """Index every value under its dotted path (sections included)."""
+        for k, v in node.items():
+            path = prefix + k
+            self._flat[path] = v
+            if isinstance(v, dict):
+                self._flatten(path + '.', v)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get configuration value by dotted key (e.g. 'exchange.main_wallet')."""
+        return self._flat.get(key, default)
+    
+    def compile_path(self, key: str, default: Any = None) -> Callable[[], Any]:
+        """Pre-bind a dotted-key lookup for callers that read it in a loop.
         
-        return value
+        Args:
+            key: Dotted configuration key
+            default: Value returned when the key is absent
+            
+        Returns:
+            Zero-argument callable returning the current value (tracks reloads)
+        """
+        lookup = self._flat.get
+        return lambda: lookup(key, default)
     
     def get_exchange_config(self) -> Dict[str, Any]:
         """Get exchange configuration."""
-        return self.config.get('exchange', {})
+        return self.exchange_config
     
     def get_asset_config(self) -> Dict[str, Any]:
         """Get asset configuration."""
-        return self.config.get('asset', {})
+        return self.asset_config
     
     def get_fees_config(self) -> Dict[str, Any]:
         """Get fees configuration."""
-        return self.config.get('fees', {})
+        return self.fees_config
     
     def get_volatility_config(self) -> Dict[str, Any]:
         """Get volatility configuration."""
-        return self.config.get('volatility', {})
+        return self.volatility_config
     
     def get_risk_config(self) -> Dict[str, Any]:
         """Get risk configuration."""
-        return self.config.get('risk', {})
+        return self.risk_config
     
     def get_trading_config(self) -> Dict[str, Any]:
         """Get trading configuration."""
-        return self.config.get('trading', {})
+        return self.trading_config
     
     def get_volume_config(self) -> Dict[str, Any]:
         """Get volume generation configuration."""
-        return self.config.get('volume', {}) 
\ No newline at end of file
+        return self.volume_config
\ No newline at end of file
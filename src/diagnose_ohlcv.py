@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # No need to modify sys.path when running as a module
 
@@ -21,26 +22,24 @@ if __name__ == "__main__":
     timeframe = '1h'
     limit = 15
 
-    print(f"\nTesting OHLCV and ticker for spot: {spot_symbol}")
-    try:
-        ohlcv = exchange.exchange.fetch_ohlcv(spot_symbol, timeframe, limit=limit)
-        print(f"OHLCV ({spot_symbol}, {timeframe}, {limit}): {ohlcv if ohlcv else 'No data'}")
-    except Exception as e:
-        print(f"❌ Error fetching OHLCV for {spot_symbol}: {e}")
-    try:
-        ticker = exchange.exchange.fetch_ticker(spot_symbol)
-        print(f"Ticker ({spot_symbol}): {ticker}")
-    except Exception as e:
-        print(f"❌ Error fetching ticker for {spot_symbol}: {e}")
+    # The four requests are independent, so issue them concurrently and
+    # report in the original order (sockets release the GIL while waiting)
+    ccxt_exchange = exchange.exchange
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {}
+        for symbol in (spot_symbol, perp_symbol):
+            futures[(symbol, 'ohlcv')] = executor.submit(ccxt_exchange.fetch_ohlcv, symbol, timeframe, limit=limit)
+            futures[(symbol, 'ticker')] = executor.submit(ccxt_exchange.fetch_ticker, symbol)
 
-    print(f"\nTesting OHLCV and ticker for perp: {perp_symbol}")
-    try:
-        ohlcv = exchange.exchange.fetch_ohlcv(perp_symbol, timeframe, limit=limit)
-        print(f"OHLCV ({perp_symbol}, {timeframe}, {limit}): {ohlcv if ohlcv else 'No data'}")
-    except Exception as e:
-        print(f"❌ Error fetching OHLCV for {perp_symbol}: {e}")
-    try:
-        ticker = exchange.exchange.fetch_ticker(perp_symbol)
-        print(f"Ticker ({perp_symbol}): {ticker}")
-    except Exception as e:
-        print(f"❌ Error fetching ticker for {perp_symbol}: {e}") 
\ No newline at end of file
+    for label, symbol in (('spot', spot_symbol), ('perp', perp_symbol)):
+        print(f"\nTesting OHLCV and ticker for {label}: {symbol}")
+        try:
+            ohlcv = futures[(symbol, 'ohlcv')].result()
+            print(f"OHLCV ({symbol}, {timeframe}, {limit}): {ohlcv if ohlcv else 'No data'}")
+        except Exception as e:
+            print(f"❌ Error fetching OHLCV for {symbol}: {e}")
+        try:
+            ticker = futures[(symbol, 'ticker')].result()
+            print(f"Ticker ({symbol}): {ticker}")
+        except Exception as e:
+            print(f"❌ Error fetching ticker for {symbol}: {e}")
@@ -1,11 +1,31 @@
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from typing import Optional
 
+# Every MarketMakerLogger feeds the shared 'market_maker' logger, so only one
+# queue listener runs per process; a new instance replaces the previous one
+_active_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_active_listener() -> None:
+    """Stop the running listener, flushing queued records and closing its handlers."""
+    global _active_listener
+    if _active_listener is not None:
+        _active_listener.stop()  # Drains queued records before returning
+        for handler in _active_listener.handlers:
+            handler.close()
+        _active_listener = None
+
+# Flush queued records even if cleanup() is never called
+atexit.register(_stop_active_listener)
+
 class MarketMakerLogger:
     """Comprehensive logging for the market making program."""
     
+    __slots__ = ('log_dir', 'log_level', 'logger', '_log_queue', '_listener')
+    
     def __init__(self, log_dir: str = "logs", log_level: str = "INFO"):
         """Initialize the logger.
         
@@ -23,8 +43,9 @@ class MarketMakerLogger:
         self.logger = logging.getLogger('market_maker')
         self.logger.setLevel(self.log_level)
         
-        # Clear existing handlers
+        # Clear existing handlers and retire the previous instance's listener
         self.logger.handlers.clear()
+        _stop_active_listener()
         
         # Create formatters
         detailed_formatter = logging.Formatter(
@@ -34,9 +55,10 @@ class MarketMakerLogger:
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         
-        # File handler for detailed logging
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, f'market_maker_{datetime.now().strftime("%Y%m%d")}.log')
+        # File handler for detailed logging, rolled over at midnight (two weeks kept)
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            os.path.join(log_dir, 'market_maker.log'),
+            when='midnight', backupCount=14, delay=True, encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
@@ -46,64 +68,78 @@ class MarketMakerLogger:
         console_handler.setLevel(self.log_level)
         console_handler.setFormatter(simple_formatter)
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Callers only enqueue records; a background listener thread does the
+        # formatting and file/console I/O so disk stalls never block trading.
+        # SimpleQueue's put is a single C call with no Python-level lock, so
+        # the trading thread never contends with the listener on hand-off
+        self._log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        global _active_listener
+        _active_listener = self._listener
     
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args) -> None:
+        """Log debug message (``args`` are %-formatted only if emitted)."""
+        self.logger.debug(message, *args)
     
-    def info(self, message: str) -> None:
-        """Log info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args) -> None:
+        """Log info message (``args`` are %-formatted only if emitted)."""
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
-        """Log warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args) -> None:
+        """Log warning message (``args`` are %-formatted only if emitted)."""
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
-        """Log error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args) -> None:
+        """Log error message (``args`` are %-formatted only if emitted)."""
+        self.logger.error(message, *args)
     
-    def critical(self, message: str) -> None:
-        """Log critical message."""
-        self.logger.critical(message)
+    def critical(self, message: str, *args) -> None:
+        """Log critical message (``args`` are %-formatted only if emitted)."""
+        self.logger.critical(message, *args)
     
     def log_trade(self, side: str, symbol: str, amount: float, price: float, 
                   order_id: Optional[str] = None) -> None:
         """Log trade information."""
-        message = f"TRADE: {side} {amount} {symbol} @ {price}"
         if order_id:
-            message += f" (Order ID: {order_id})"
-        self.info(message)
+            self.logger.info("TRADE: %s %s %s @ %s (Order ID: %s)", side, amount, symbol, price, order_id)
+        else:
+            self.logger.info("TRADE: %s %s %s @ %s", side, amount, symbol, price)
     
     def log_quote(self, symbol: str, bid: float, ask: float, spread: float) -> None:
         """Log quote information."""
-        self.info(f"QUOTE: {symbol} Bid: {bid}, Ask: {ask}, Spread: {spread:.4f}")
+        self.logger.info("QUOTE: %s Bid: %s, Ask: %s, Spread: %.4f", symbol, bid, ask, spread)
     
     def log_funding_rate(self, symbol: str, rate: float, timestamp: Optional[str] = None) -> None:
         """Log funding rate information."""
-        message = f"FUNDING: {symbol} Rate: {rate:.6f}"
         if timestamp:
-            message += f" (Time: {timestamp})"
-        self.info(message)
+            self.logger.info("FUNDING: %s Rate: %.6f (Time: %s)", symbol, rate, timestamp)
+        else:
+            self.logger.info("FUNDING: %s Rate: %.6f", symbol, rate)
     
     def log_volatility(self, symbol: str, atr: float, volatility: float) -> None:
         """Log volatility information."""
-        self.info(f"VOLATILITY: {symbol} ATR: {atr:.4f}, Vol: {volatility:.4f}")
+        self.logger.info("VOLATILITY: %s ATR: %.4f, Vol: %.4f", symbol, atr, volatility)
     
     def log_inventory(self, symbol: str, inventory: float, pnl: float) -> None:
         """Log inventory and PnL information."""
-        self.info(f"INVENTORY: {symbol} Size: {inventory:.4f}, PnL: {pnl:.4f}")
+        self.logger.info("INVENTORY: %s Size: %.4f, PnL: %.4f", symbol, inventory, pnl)
     
     def log_error(self, error: Exception, context: str = "") -> None:
         """Log error with context."""
-        message = f"ERROR in {context}: {str(error)}"
-        self.error(message)
+        self.logger.error("ERROR in %s: %s", context, error)
     
     def cleanup(self) -> None:
         """Clean up logger resources."""
-        for handler in self.logger.handlers[:]:
-            handler.close()
-            self.logger.removeHandler(handler) 
\ No newline at end of file
+        if self._listener is None:
+            return
+        # A newer instance has taken over the shared logger; leave it alone
+        if self._listener is _active_listener:
+            _stop_active_listener()
+            for handler in self.logger.handlers[:]:
+                handler.close()
+                self.logger.removeHandler(handler)
+        self._listener = None 
\ No newline at end of file
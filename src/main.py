@@ -1,8 +1,11 @@
+import asyncio
 import time
 import signal
 import sys
 import os
-from typing import Dict, Any, Optional
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
 from config import ConfigManager
 from logger import MarketMakerLogger
 from exchange import HyperliquidExchange
@@ -13,6 +16,15 @@ from risk_manager import RiskManager
 class MarketMaker:
     """Main market making program orchestrator."""
     
+    # Components are plain attributes; see the ``components`` property
+    _COMPONENT_NAMES = ('config', 'logger', 'exchange', 'volatility', 'risk', 'strategy')
+    
+    __slots__ = (
+        'config_path', 'running', 'config', 'logger', 'exchange', 'volatility', 'risk', 'strategy',
+        'cycle_times', 'last_cycle_time', 'performance_stats', '_loop', '_wakeup',
+        '_ct_sum', '_ct_minmax', '_sigwait_thread', '_saved_sigmask', '_saved_handlers'
+    )
+    
     def __init__(self, config_path: str = "config.json"):
         """Initialize the market maker.
         
@@ -21,66 +33,133 @@ class MarketMaker:
         """
         self.config_path = config_path
         self.running = False
-        self.components = {}
+        self._loop = None  # Event loop driving run_async, if any
+        self._wakeup = None  # Set by stop() to cut an inter-cycle sleep short
         
-        # Performance tracking
-        self.cycle_times = []
+        # Performance tracking (cycle_times holds the last 100 durations in ns)
+        self.cycle_times = deque(maxlen=100)
+        self._ct_sum = 0  # Running sum of cycle_times
+        self._ct_minmax = None  # Cached (min, max) of cycle_times; None when stale
         self.last_cycle_time = 0.0
         self.performance_stats = {}
         
+        # Signal handling state, installed by run() and undone by cleanup()
+        self._sigwait_thread = None
+        self._saved_sigmask = None
+        self._saved_handlers = {}
+        
         # Initialize components
         self._initialize_components()
-        
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
     
     def _initialize_components(self) -> None:
         """Initialize all program components."""
         try:
             # Initialize configuration
-            self.components['config'] = ConfigManager(self.config_path)
+            self.config = ConfigManager(self.config_path)
             
             # Initialize logger with log level from environment variable
             log_level = os.getenv("LOG_LEVEL", "INFO")
-            self.components['logger'] = MarketMakerLogger(log_level=log_level)
+            self.logger = MarketMakerLogger(log_level=log_level)
             
             # Initialize exchange
-            self.components['exchange'] = HyperliquidExchange(
-                self.components['config'],
-                self.components['logger']
+            self.exchange = HyperliquidExchange(
+                self.config,
+                self.logger
             )
             
             # Initialize volatility calculator
-            self.components['volatility'] = VolatilityCalculator(
-                self.components['config'],
-                self.components['logger']
+            self.volatility = VolatilityCalculator(
+                self.config,
+                self.logger
             )
             
             # Initialize risk manager
-            self.components['risk'] = RiskManager(
-                self.components['config'],
-                self.components['logger']
+            self.risk = RiskManager(
+                self.config,
+                self.logger
             )
             
             # Initialize strategy
-            self.components['strategy'] = MarketMakingStrategy(
-                self.components['config'],
-                self.components['exchange'],
-                self.components['volatility'],
-                self.components['risk'],
-                self.components['logger']
+            self.strategy = MarketMakingStrategy(
+                self.config,
+                self.exchange,
+                self.volatility,
+                self.risk,
+                self.logger
             )
             
-            self.components['logger'].info("All components initialized successfully")
+            self.logger.info("All components initialized successfully")
             
         except Exception as e:
             print(f"Failed to initialize components: {e}")
             sys.exit(1)
     
+    def _install_signal_handling(self) -> None:
+        """Route SIGINT/SIGTERM to stop() for the duration of run().
+        
+        The signals are blocked on the calling thread, which every thread
+        started afterwards inherits, and a single sigwait thread picks them
+        up. Threads that already exist (the log listener) keep an open mask,
+        so Python-level handlers are installed as well for signals the
+        kernel delivers there. Only done on the main thread; cleanup()
+        restores the previous mask and handlers.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        shutdown_signals = {signal.SIGINT, signal.SIGTERM}
+        for sig in shutdown_signals:
+            self._saved_handlers[sig] = signal.signal(sig, self._signal_handler)
+        if hasattr(signal, 'pthread_sigmask'):
+            self._saved_sigmask = signal.pthread_sigmask(signal.SIG_BLOCK, shutdown_signals)
+            self._sigwait_thread = threading.Thread(
+                target=self._sigwait_loop, args=(shutdown_signals,),
+                name='signal-wait', daemon=True
+            )
+            self._sigwait_thread.start()
+    
+    def _restore_signal_handling(self) -> None:
+        """Stop the sigwait thread and restore the signal mask and handlers."""
+        thread, self._sigwait_thread = self._sigwait_thread, None
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            # The signal is blocked there, so it just wakes sigwait, which
+            # then sees it has been retired
+            signal.pthread_kill(thread.ident, signal.SIGTERM)
+            thread.join(1.0)
+        if self._saved_sigmask is not None:
+            signal.pthread_sigmask(signal.SIG_SETMASK, self._saved_sigmask)
+            self._saved_sigmask = None
+        for sig, handler in self._saved_handlers.items():
+            signal.signal(sig, handler)
+        self._saved_handlers.clear()
+    
+    def _sigwait_loop(self, signals: set) -> None:
+        """Wait for blocked shutdown signals on a dedicated thread.
+        
+        Signals never interrupt the trading loop mid-cycle; stopping just
+        clears ``running``, which the loop checks between cycles.
+        
+        Args:
+            signals: Signal numbers blocked on the threads started by run()
+        """
+        current = threading.current_thread()
+        while True:
+            signum = signal.sigwait(signals)
+            if self._sigwait_thread is not current:
+                return  # Woken by _restore_signal_handling
+            self._signal_handler(signum, None)
+    
+    @property
+    def components(self) -> Dict[str, Any]:
+        """Initialized components keyed by name.
+        
+        Returns:
+            Dictionary of component name to instance
+        """
+        return {name: getattr(self, name) for name in self._COMPONENT_NAMES if hasattr(self, name)}
+    
     def _signal_handler(self, signum, frame) -> None:
         """Handle shutdown signals."""
-        self.components['logger'].info(f"Received signal {signum}, shutting down gracefully...")
+        self.logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.stop()
     
     def connect_to_exchange(self) -> bool:
@@ -90,15 +169,15 @@ class MarketMaker:
             True if connection successful, False otherwise
         """
         try:
-            success = self.components['exchange'].connect()
+            success = self.exchange.connect()
             if success:
-                self.components['logger'].info("Successfully connected to exchange")
+                self.logger.info("Successfully connected to exchange")
             else:
-                self.components['logger'].error("Failed to connect to exchange")
+                self.logger.error("Failed to connect to exchange")
             return success
             
         except Exception as e:
-            self.components['logger'].log_error(e, "Exchange connection")
+            self.logger.log_error(e, "Exchange connection")
             return False
     
     def validate_configuration(self) -> bool:
@@ -108,9 +187,9 @@ class MarketMaker:
             True if validation successful, False otherwise
         """
         try:
-            config = self.components['config']
-            exchange = self.components['exchange']
-            logger = self.components['logger']
+            config = self.config
+            exchange = self.exchange
+            logger = self.logger
             
             # Check required configuration
             asset_config = config.get_asset_config()
@@ -145,28 +224,31 @@ class MarketMaker:
             return True
             
         except Exception as e:
-            self.components['logger'].log_error(e, "Configuration validation")
+            self.logger.log_error(e, "Configuration validation")
             return False
     
-    def run_single_cycle(self) -> bool:
-        """Run a single market making cycle with performance monitoring and step profiling."""
-        cycle_start_time = time.time()
-        step_times = {}
+    def run_single_cycle(self, volatility: Optional[float] = None) -> bool:
+        """Run a single market making cycle with performance monitoring.
+        
+        Args:
+            volatility: Volatility already measured for this cycle, passed on
+                to the strategy so it is not recomputed
+        """
+        cycle_start_ns = time.perf_counter_ns()
         try:
-            strategy = self.components['strategy']
-            logger = self.components['logger']
-            t0 = time.time()
-            result = strategy.execute_strategy_cycle()
-            step_times['execute_strategy_cycle'] = time.time() - t0
-            cycle_time = time.time() - cycle_start_time
+            strategy = self.strategy
+            logger = self.logger
+            t0_ns = time.perf_counter_ns()
+            result = strategy.execute_strategy_cycle(volatility)
+            exec_time_ns = time.perf_counter_ns() - t0_ns
+            cycle_time_ns = time.perf_counter_ns() - cycle_start_ns
+            self._record_cycle_time(cycle_time_ns)
+            cycle_time = cycle_time_ns / 1e9
             self.last_cycle_time = cycle_time
-            self.cycle_times.append(cycle_time)
-            if len(self.cycle_times) > 100:
-                self.cycle_times = self.cycle_times[-100:]
             if result['success']:
-                logger.info(f"Cycle completed: Mid={result['mid_price']:.4f}, "
-                          f"Spread={result['spread']:.4f}, Vol={result['volatility']:.4f}, "
-                          f"Time={cycle_time:.3f}s, StepTimes={step_times}")
+                logger.info("Cycle completed: Mid=%.4f, Spread=%.4f, Vol=%.4f, Time=%.3fs, Step=%.3fs",
+                            result['mid_price'], result['spread'], result['volatility'],
+                            cycle_time, exec_time_ns / 1e9)
                 # Defensive: ensure funding_income is a float
                 funding_income = result['funding_income']
                 if isinstance(funding_income, dict):
@@ -187,18 +269,50 @@ class MarketMaker:
                     logger.warning(f"Cycle time exceeded 5s: {cycle_time:.3f}s")
                 return True
             else:
-                if result.get('trading_paused'):
+                if result.get('disconnected'):
+                    logger.warning("Exchange disconnected, reconnecting")
+                    self.connect_to_exchange()
+                elif result.get('trading_paused'):
                     logger.warning(f"Trading paused: {result['error']}")
                 else:
                     logger.error(f"Cycle failed: {result['error']}")
                 return False
         except Exception as e:
-            cycle_time = time.time() - cycle_start_time
-            self.last_cycle_time = cycle_time
-            self.cycle_times.append(cycle_time)
-            self.components['logger'].log_error(e, "Strategy cycle")
+            cycle_time_ns = time.perf_counter_ns() - cycle_start_ns
+            self._record_cycle_time(cycle_time_ns)
+            self.last_cycle_time = cycle_time_ns / 1e9
+            self.logger.log_error(e, "Strategy cycle")
             return False
     
+    def _record_cycle_time(self, cycle_time_ns: int) -> None:
+        """Append a cycle duration, keeping the running aggregates in step.
+        
+        Args:
+            cycle_time_ns: Cycle duration in nanoseconds
+        """
+        cycle_times = self.cycle_times
+        if len(cycle_times) == cycle_times.maxlen:
+            self._ct_sum -= cycle_times[0]
+        cycle_times.append(cycle_time_ns)
+        self._ct_sum += cycle_time_ns
+        self._ct_minmax = None
+    
+    def _cycle_time_stats(self) -> Dict[str, Any]:
+        """Return avg/min/max/count of recent cycle times in seconds."""
+        count = len(self.cycle_times)
+        if not count:
+            return {'avg': 0, 'min': 0, 'max': 0, 'count': 0}
+        minmax = self._ct_minmax
+        if minmax is None:
+            # Recomputed at most once per cycle, however often stats are polled
+            minmax = self._ct_minmax = (min(self.cycle_times), max(self.cycle_times))
+        return {
+            'avg': self._ct_sum / count / 1e9,
+            'min': minmax[0] / 1e9,
+            'max': minmax[1] / 1e9,
+            'count': count
+        }
+    
     def optimize_update_interval(self, current_interval: float) -> float:
         """Optimize update interval based on performance.
         
@@ -211,19 +325,19 @@ class MarketMaker:
         if not self.cycle_times:
             return current_interval
         
-        avg_cycle_time = sum(self.cycle_times) / len(self.cycle_times)
+        avg_cycle_time = self._ct_sum / len(self.cycle_times) / 1e9
         
         # If cycles are taking longer than 80% of the interval, increase it
         if avg_cycle_time > current_interval * 0.8:
             new_interval = max(current_interval * 1.2, avg_cycle_time * 1.1)
-            self.components['logger'].info(f"Optimizing interval: {current_interval}s -> {new_interval:.1f}s "
+            self.logger.info(f"Optimizing interval: {current_interval}s -> {new_interval:.1f}s "
                                          f"(avg cycle time: {avg_cycle_time:.2f}s)")
             return new_interval
         
         # If cycles are much faster, we can decrease the interval
         elif avg_cycle_time < current_interval * 0.3:
             new_interval = max(current_interval * 0.8, 1.0)  # Minimum 1 second
-            self.components['logger'].info(f"Optimizing interval: {current_interval}s -> {new_interval:.1f}s "
+            self.logger.info(f"Optimizing interval: {current_interval}s -> {new_interval:.1f}s "
                                          f"(avg cycle time: {avg_cycle_time:.2f}s)")
             return new_interval
         
@@ -248,14 +362,9 @@ class MarketMaker:
             Dictionary with performance statistics
         """
         stats = {
-            'cycle_times': {
-                'avg': sum(self.cycle_times) / len(self.cycle_times) if self.cycle_times else 0,
-                'min': min(self.cycle_times) if self.cycle_times else 0,
-                'max': max(self.cycle_times) if self.cycle_times else 0,
-                'count': len(self.cycle_times)
-            },
-            'exchange': self.components['exchange'].get_performance_stats(),
-            'volatility': self.components['volatility'].get_cache_stats()
+            'cycle_times': self._cycle_time_stats(),
+            'exchange': self.exchange.get_performance_stats(),
+            'volatility': self.volatility.get_cache_stats()
         }
         
         return stats
@@ -263,38 +372,96 @@ class MarketMaker:
     def log_performance_summary(self) -> None:
         """Log performance summary."""
         stats = self.collect_performance_stats()
-        logger = self.components['logger']
+        logger = self.logger
         
         logger.info("=== PERFORMANCE SUMMARY ===")
-        logger.info(f"Cycle times - Avg: {stats['cycle_times']['avg']:.3f}s, "
-                   f"Min: {stats['cycle_times']['min']:.3f}s, "
-                   f"Max: {stats['cycle_times']['max']:.3f}s")
+        cycle_stats = stats['cycle_times']
+        logger.info("Cycle times - Avg: %.3fs, Min: %.3fs, Max: %.3fs",
+                    cycle_stats['avg'], cycle_stats['min'], cycle_stats['max'])
         
         # Exchange performance
         exchange_stats = stats['exchange']
         if 'operation_averages' in exchange_stats:
             logger.info("Exchange operations:")
             for op, op_stats in exchange_stats['operation_averages'].items():
-                logger.info(f"  {op}: {op_stats['mean']:.3f}s avg")
+                logger.info("  %s: %.3fs avg", op, op_stats['mean'])
         
         # Volatility cache performance
         vol_stats = stats['volatility']
-        logger.info(f"Volatility cache - Hit rate: {vol_stats['hit_rate']:.1f}%, "
-                   f"Avg calc time: {vol_stats['avg_calculation_time']:.3f}s")
+        logger.info("Volatility cache - Hit rate: %.1f%%, Avg calc time: %.3fs",
+                    vol_stats['hit_rate'], vol_stats['avg_calculation_time'])
         
         # Performance recommendations
-        optimizer = self.components['exchange'].performance_optimizer
+        optimizer = self.exchange.performance_optimizer
         recommendations = optimizer.get_recommendations()
         if recommendations:
             logger.info("Performance recommendations:")
             for rec in recommendations:
-                logger.info(f"  - {rec}")
+                logger.info("  - %s", rec)
+    
+    def _pin_to_cpus(self, cpus: List[int]) -> None:
+        """Pin the whole process to the given CPU cores to avoid migration jitter.
+        
+        On Linux sched_setaffinity applies to a single thread, so the mask is
+        set on every thread listed in /proc/self/task (the loop thread plus
+        the log listener, sigwait and pool workers already running); threads
+        started afterwards inherit it. Where /proc is unavailable only the
+        calling thread and its future children are pinned.
+        
+        Args:
+            cpus: CPU core indices; empty leaves scheduling untouched
+        """
+        if not cpus:
+            return
+        logger = self.logger
+        if not hasattr(os, 'sched_setaffinity'):
+            logger.warning("cpu_affinity is set but not supported on this platform")
+            return
+        cpu_set = set(cpus)
+        try:
+            thread_ids = [int(tid) for tid in os.listdir('/proc/self/task')]
+        except OSError:
+            thread_ids = [0]
+        try:
+            for tid in thread_ids:
+                try:
+                    os.sched_setaffinity(tid, cpu_set)
+                except ProcessLookupError:
+                    pass  # Thread exited since the listing
+            logger.info(f"Pinned {len(thread_ids)} threads to CPUs {sorted(cpus)}")
+        except OSError as e:
+            logger.log_error(e, f"Setting CPU affinity to {cpus}")
     
     def run(self) -> None:
         """Run the main market making loop with performance optimization."""
+        self._install_signal_handling()
         try:
-            logger = self.components['logger']
-            config = self.components['config']
+            asyncio.run(self.run_async())
+        finally:
+            self._restore_signal_handling()
+    
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep between cycles, returning early if stop() is called.
+        
+        Args:
+            seconds: Maximum time to sleep
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def run_async(self) -> None:
+        """Run the main market making loop on an asyncio event loop.
+        
+        Blocking exchange work runs in worker threads, so the next cycle's
+        volatility fetch overlaps the inter-cycle sleep.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            logger = self.logger
+            config = self.config
             
             logger.info("Starting market making program...")
             
@@ -309,85 +476,101 @@ class MarketMaker:
                 return
             
             # Get update interval
-            update_interval = config.get_trading_config().get('update_interval', 5)
+            trading_config = config.get_trading_config()
+            update_interval = trading_config.get('update_interval', 5)
             
             logger.info(f"Starting market making loop with {update_interval}s intervals")
             
             self.running = True
             cycle_count = 0
             last_performance_log = time.time()
+            last_cache_sweep = time.monotonic()
+            
+            # Loop invariants, bound once instead of looked up every cycle
+            strategy = self.strategy
+            spot_symbol = strategy.spot_symbol
+            atr_period = strategy.atr_period
+            timeframe = strategy.timeframe
+            calculate_volatility = self.volatility.calculate_volatility
+            run_cycle = self.run_single_cycle
+            next_volatility = None  # Volatility prefetched during the last sleep
+            
+            self._pin_to_cpus(trading_config.get('cpu_affinity', []))
             
             while self.running:
                 try:
                     cycle_count += 1
-                    logger.debug(f"=== Cycle {cycle_count} START ===")
-                    logger.debug(f"Sleeping for {update_interval}s before next cycle...")
+                    logger.debug("=== Cycle %s START ===", cycle_count)
+                    logger.debug("Sleeping for %ss before next cycle...", update_interval)
                     # Calculate real volatility before skip check
-                    strategy = self.components['strategy']
-                    volatility = self.components['volatility'].calculate_volatility(
-                        strategy.spot_symbol,
-                        strategy.volatility_config.get('atr_period', 14),
-                        strategy.volatility_config.get('timeframe', '1h')
-                    )
-                    logger.debug(f"Cycle {cycle_count}: Measured volatility: {volatility}")
+                    if next_volatility is not None:
+                        prefetched, next_volatility = next_volatility, None
+                        volatility = await prefetched
+                    else:
+                        volatility = await self._loop.run_in_executor(
+                            None, calculate_volatility, spot_symbol, atr_period, timeframe
+                        )
+                    logger.debug("Cycle %s: Measured volatility: %s", cycle_count, volatility)
                     if self.should_skip_cycle(volatility):
-                        logger.debug(f"Cycle {cycle_count} skipped (should_skip_cycle returned True)")
-                        time.sleep(update_interval)
+                        logger.debug("Cycle %s skipped (should_skip_cycle returned True)", cycle_count)
+                        await self._sleep(update_interval)
                         continue
-                    logger.debug(f"Cycle {cycle_count}: Running strategy cycle...")
+                    logger.debug("Cycle %s: Running strategy cycle...", cycle_count)
                     # Run strategy cycle
-                    success = self.run_single_cycle()
-                    logger.debug(f"Cycle {cycle_count}: Strategy cycle completed. Success: {success}")
+                    success = await self._loop.run_in_executor(None, run_cycle, volatility)
+                    logger.debug("Cycle %s: Strategy cycle completed. Success: %s", cycle_count, success)
                     if not success:
                         logger.warning(f"Cycle {cycle_count} failed. Waiting {update_interval * 2}s before retrying.")
-                        time.sleep(update_interval * 2)
+                        await self._sleep(update_interval * 2)
                     else:
                         # Optimize interval based on performance
                         update_interval = self.optimize_update_interval(update_interval)
-                        logger.debug(f"Cycle {cycle_count}: Sleeping for {update_interval}s after successful cycle.")
-                        time.sleep(update_interval)
-                    # Periodic cleanup and performance logging
-                    if cycle_count % 10 == 0:
-                        logger.debug(f"Cycle {cycle_count}: Clearing caches.")
-                        self.components['volatility'].clear_cache()
-                        self.components['exchange'].clear_performance_cache()
-                        logger.debug("Cleared caches")
+                        logger.debug("Cycle %s: Sleeping for %ss after successful cycle.", cycle_count, update_interval)
+                        # Fetch the next cycle's volatility while we wait
+                        next_volatility = self._loop.run_in_executor(
+                            None, calculate_volatility, spot_symbol, atr_period, timeframe
+                        )
+                        await self._sleep(update_interval)
+                    # Periodically sweep expired cache entries; fresh ones stay warm
+                    if time.monotonic() - last_cache_sweep > 60:
+                        evicted = self.volatility.evict_expired() + self.exchange.evict_expired_cache()
+                        logger.debug("Cycle %s: Evicted %s expired cache entries", cycle_count, evicted)
+                        last_cache_sweep = time.monotonic()
                     # Log performance summary every 5 minutes
                     if time.time() - last_performance_log > 300:  # 5 minutes
-                        logger.debug(f"Cycle {cycle_count}: Logging performance summary.")
+                        logger.debug("Cycle %s: Logging performance summary.", cycle_count)
                         self.log_performance_summary()
                         last_performance_log = time.time()
-                    logger.debug(f"=== Cycle {cycle_count} END ===")
-                except KeyboardInterrupt:
-                    logger.info("Received keyboard interrupt")
-                    break
+                    logger.debug("=== Cycle %s END ===", cycle_count)
                 except Exception as e:
                     logger.log_error(e, f"Main loop cycle {cycle_count}")
                     logger.error(f"Exception in main loop cycle {cycle_count}: {e}")
-                    time.sleep(update_interval)
+                    await self._sleep(update_interval)
             logger.info("Market making loop stopped")
         except Exception as e:
-            self.components['logger'].log_error(e, "Main program execution")
+            self.logger.log_error(e, "Main program execution")
         finally:
             self.cleanup()
     
     def stop(self) -> None:
         """Stop the market making program."""
-        self.components['logger'].info("Stopping market making program...")
+        self.logger.info("Stopping market making program...")
         self.running = False
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
     
     def cleanup(self) -> None:
         """Clean up resources before shutdown."""
         try:
-            logger = self.components['logger']
-            strategy = self.components['strategy']
+            logger = self.logger
+            strategy = self.strategy
             
             # Cancel all open orders
             strategy.cancel_spot_orders()
             
             # Log final summary
             strategy_summary = strategy.get_strategy_summary()
-            risk_summary = self.components['risk'].get_risk_summary()
+            risk_summary = self.risk.get_risk_summary()
             
             logger.info("=== FINAL SUMMARY ===")
             logger.info(f"Strategy: {strategy_summary}")
@@ -396,6 +579,9 @@ class MarketMaker:
             # Log final performance summary
             self.log_performance_summary()
             
+            self.exchange.close()
+            self._restore_signal_handling()
+            
             logger.info("Cleanup completed")
             
         except Exception as e:
@@ -410,9 +596,9 @@ class MarketMaker:
         try:
             return {
                 'running': self.running,
-                'strategy': self.components['strategy'].get_strategy_summary(),
-                'risk': self.components['risk'].get_risk_summary(),
-                'exchange_connected': self.components['exchange'].connected,
+                'strategy': self.strategy.get_strategy_summary(),
+                'risk': self.risk.get_risk_summary(),
+                'exchange_connected': self.exchange.connected,
                 'performance': self.collect_performance_stats()
             }
         except Exception as e:
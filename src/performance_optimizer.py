@@ -1,13 +1,51 @@
 import asyncio
+import functools
 import time
 import threading
 import statistics
-from typing import Dict, List, Optional, Tuple, Any, Callable
-from collections import deque
+from typing import Dict, List, Optional, Tuple, Any, Callable, Hashable
+from collections import defaultdict, deque
 import numpy as np
 from config import ConfigManager
 from logger import MarketMakerLogger
 
+class _TimingBuffer:
+    """Fixed-size ring buffer of operation durations backed by a NumPy array."""
+    
+    __slots__ = ('buf', 'cursor', 'count')
+    
+    def __init__(self, size: int = 100):
+        self.buf = np.empty(size, dtype=np.float64)
+        self.cursor = 0
+        self.count = 0
+    
+    def append(self, duration: float) -> None:
+        """Record a duration, overwriting the oldest once full."""
+        self.buf[self.cursor] = duration
+        self.cursor = (self.cursor + 1) % len(self.buf)
+        if self.count < len(self.buf):
+            self.count += 1
+    
+    def values(self) -> np.ndarray:
+        """Recorded durations as an array view (unordered once wrapped)."""
+        return self.buf[:self.count]
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class _MarketCacheEntry:
+    """Cached ticker and order book for one symbol, with their fetch times."""
+    
+    __slots__ = ('price', 'price_ts', 'order_book', 'order_book_ts')  # *_ts are time.monotonic()
+    
+    def __init__(self):
+        self.price = None
+        self.price_ts = 0.0
+        self.order_book = None
+        self.order_book_ts = 0.0
+
+
 class PerformanceOptimizer:
     """Performance optimization utilities for market making system."""
     
@@ -22,19 +60,21 @@ class PerformanceOptimizer:
         self.logger = logger
         
         # Performance monitoring
-        self.operation_times = {}
+        self.operation_times = defaultdict(_TimingBuffer)  # Last 100 durations per operation
         self.api_call_count = 0
         self.api_call_times = deque(maxlen=1000)
+        self.record_enabled = True  # Time exchange operations (see exchange._timed)
         
-        # Caching
-        self.price_cache = {}
+        # Caching (price and order book share one entry per symbol)
+        self.market_cache: Dict[str, _MarketCacheEntry] = {}
         self.price_cache_ttl = 1.0  # Increased to 1s TTL for price data
-        self.order_book_cache = {}
+        self.price_cache_stale_ttl = 3.0  # Stale prices may be served (while refreshing) up to 3s
         self.order_book_cache_ttl = 2.0  # Increased to 2s TTL for order book
+        self.ttl_cache = {}  # Generic entries with per-entry TTL (see cache_with_ttl)
         
         # Rate limiting
-        self.last_api_call = {}
-        self.min_api_interval = 0.05  # 50ms minimum between API calls
+        self.last_api_call = {}  # Operation -> time.monotonic_ns() of its last allowed call
+        self.min_api_interval_ns = 50_000_000  # 50ms minimum between API calls
         
         # Batch operations
         self.pending_orders = []
@@ -45,6 +85,15 @@ class PerformanceOptimizer:
         self.max_ticker_response_time = 0.5  # 500ms
         self.max_order_response_time = 1.0   # 1 second
         self.max_volatility_calc_time = 0.1  # 100ms
+        self._thresholds = {
+            'get_ticker': self.max_ticker_response_time,
+            'get_tickers': self.max_ticker_response_time,
+            'get_order_book': self.max_ticker_response_time,
+            'place_order': self.max_order_response_time,
+            'cancel_order': self.max_order_response_time,
+            'calculate_volatility': self.max_volatility_calc_time,
+            'calculate_atr': self.max_volatility_calc_time
+        }
         
         self.logger.info("Performance optimizer initialized")
     
@@ -58,35 +107,43 @@ class PerformanceOptimizer:
             Decorator function
         """
         def decorator(func):
+            # Resolve everything the wrapper needs once, at decoration time,
+            # so each timed call is just two clock reads and a buffer write
+            record = self.operation_times[operation_name].append
+            threshold = self._thresholds.get(operation_name, 1.0)
+            perf_counter = time.perf_counter
+            
+            @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start = perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    end_time = time.time()
-                    duration = end_time - start_time
-                    
-                    # Store timing data
-                    if operation_name not in self.operation_times:
-                        self.operation_times[operation_name] = []
-                    self.operation_times[operation_name].append(duration)
-                    
-                    # Keep only last 100 measurements
-                    if len(self.operation_times[operation_name]) > 100:
-                        self.operation_times[operation_name] = self.operation_times[operation_name][-100:]
-                    
-                    # Log slow operations
-                    if duration > self._get_threshold(operation_name):
-                        self.logger.warning(f"Slow operation detected: {operation_name} took {duration:.3f}s")
-                    
-                    return result
                 except Exception as e:
-                    end_time = time.time()
-                    duration = end_time - start_time
+                    duration = perf_counter() - start
                     self.logger.error(f"Operation {operation_name} failed after {duration:.3f}s: {e}")
                     raise
+                duration = perf_counter() - start
+                record(duration)
+                if duration > threshold:
+                    self.logger.warning(f"Slow operation detected: {operation_name} took {duration:.3f}s")
+                return result
             return wrapper
         return decorator
     
+    def record_operation_time(self, operation_name: str, duration: float) -> None:
+        """Record a completed operation's duration and flag slow ones.
+        
+        Args:
+            operation_name: Name of the operation
+            duration: Operation duration in seconds
+        """
+        # Store timing data (the ring buffer keeps the last 100 measurements)
+        self.operation_times[operation_name].append(duration)
+        
+        # Log slow operations
+        if duration > self._get_threshold(operation_name):
+            self.logger.warning(f"Slow operation detected: {operation_name} took {duration:.3f}s")
+    
     def _get_threshold(self, operation_name: str) -> float:
         """Get performance threshold for an operation.
         
@@ -96,15 +153,7 @@ class PerformanceOptimizer:
         Returns:
             Threshold in seconds
         """
-        thresholds = {
-            'get_ticker': self.max_ticker_response_time,
-            'get_order_book': self.max_ticker_response_time,
-            'place_order': self.max_order_response_time,
-            'cancel_order': self.max_order_response_time,
-            'calculate_volatility': self.max_volatility_calc_time,
-            'calculate_atr': self.max_volatility_calc_time
-        }
-        return thresholds.get(operation_name, 1.0)
+        return self._thresholds.get(operation_name, 1.0)
     
     def cache_price_data(self, symbol: str, price_data: Dict[str, Any]) -> None:
         """Cache price data with TTL.
@@ -113,10 +162,11 @@ class PerformanceOptimizer:
             symbol: Trading symbol
             price_data: Price data to cache
         """
-        self.price_cache[symbol] = {
-            'data': price_data,
-            'timestamp': time.time()
-        }
+        entry = self.market_cache.get(symbol)
+        if entry is None:
+            entry = self.market_cache[symbol] = _MarketCacheEntry()
+        entry.price = price_data
+        entry.price_ts = time.monotonic()
     
     def get_cached_price(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached price data if still valid.
@@ -127,14 +177,36 @@ class PerformanceOptimizer:
         Returns:
             Cached price data or None if expired/missing
         """
-        if symbol in self.price_cache:
-            cache_entry = self.price_cache[symbol]
-            if time.time() - cache_entry['timestamp'] < self.price_cache_ttl:
-                return cache_entry['data']
-            else:
-                del self.price_cache[symbol]
+        entry = self.market_cache.get(symbol)
+        if entry is None or entry.price is None:
+            return None
+        if time.monotonic() - entry.price_ts < self.price_cache_ttl:
+            return entry.price
         return None
     
+    def get_cached_price_swr(self, symbol: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Get cached price data for stale-while-revalidate reads.
+        
+        Entries older than ``price_cache_ttl`` but younger than
+        ``price_cache_stale_ttl`` are still returned, flagged as stale so the
+        caller can refresh them in the background.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Tuple of (cached price data or None if expired/missing, stale flag)
+        """
+        entry = self.market_cache.get(symbol)
+        if entry is None or entry.price is None:
+            return None, False
+        age = time.monotonic() - entry.price_ts
+        if age < self.price_cache_ttl:
+            return entry.price, False
+        if age < self.price_cache_stale_ttl:
+            return entry.price, True
+        return None, False
+    
     def cache_order_book(self, symbol: str, order_book: Dict[str, Any]) -> None:
         """Cache order book data with TTL.
         
@@ -142,10 +214,11 @@ class PerformanceOptimizer:
             symbol: Trading symbol
             order_book: Order book data to cache
         """
-        self.order_book_cache[symbol] = {
-            'data': order_book,
-            'timestamp': time.time()
-        }
+        entry = self.market_cache.get(symbol)
+        if entry is None:
+            entry = self.market_cache[symbol] = _MarketCacheEntry()
+        entry.order_book = order_book
+        entry.order_book_ts = time.monotonic()
     
     def get_cached_order_book(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached order book data if still valid.
@@ -156,30 +229,82 @@ class PerformanceOptimizer:
         Returns:
             Cached order book data or None if expired/missing
         """
-        if symbol in self.order_book_cache:
-            cache_entry = self.order_book_cache[symbol]
-            if time.time() - cache_entry['timestamp'] < self.order_book_cache_ttl:
+        entry = self.market_cache.get(symbol)
+        if entry is None or entry.order_book is None:
+            return None
+        if time.monotonic() - entry.order_book_ts < self.order_book_cache_ttl:
+            return entry.order_book
+        return None
+    
+    def cache_with_ttl(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Cache a value with its own TTL.
+        
+        Lets callers match each endpoint's TTL to how often its data
+        actually changes.
+        
+        Args:
+            key: Cache key, e.g. ``('funding_rate', symbol)``
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        self.ttl_cache[key] = {
+            'data': value,
+            'expires': time.monotonic() + ttl
+        }
+    
+    def get_cached(self, key: Hashable) -> Optional[Any]:
+        """Get a value stored with ``cache_with_ttl`` if still valid.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if expired/missing
+        """
+        cache_entry = self.ttl_cache.get(key)
+        if cache_entry is not None:
+            if time.monotonic() < cache_entry['expires']:
                 return cache_entry['data']
-            else:
-                del self.order_book_cache[symbol]
+            # Expired entries stay put until cache_with_ttl overwrites them
+            # (or evict_expired sweeps them); deleting here could race with
+            # another I/O thread reading the same key
         return None
     
-    def rate_limit_api_call(self, operation: str) -> bool:
+    def invalidate_cached(self, *keys: Hashable) -> None:
+        """Drop values stored with ``cache_with_ttl``.
+        
+        Args:
+            keys: Cache keys to drop
+        """
+        for key in keys:
+            self.ttl_cache.pop(key, None)
+    
+    @property
+    def min_api_interval(self) -> float:
+        """Minimum interval between calls of one operation, in seconds."""
+        return self.min_api_interval_ns / 1e9
+    
+    @min_api_interval.setter
+    def min_api_interval(self, seconds: float) -> None:
+        self.min_api_interval_ns = int(seconds * 1e9)
+    
+    def rate_limit_api_call(self, operation: str, now_ns: Optional[int] = None) -> bool:
         """Check if enough time has passed for API call rate limiting.
         
         Args:
             operation: API operation name
+            now_ns: Current ``time.monotonic_ns()``, if the caller already has it
             
         Returns:
             True if call is allowed, False if should wait
         """
-        current_time = time.time()
-        if operation in self.last_api_call:
-            time_since_last = current_time - self.last_api_call[operation]
-            if time_since_last < self.min_api_interval:
-                return False
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        last_ns = self.last_api_call.get(operation)
+        if last_ns is not None and now_ns - last_ns < self.min_api_interval_ns:
+            return False
         
-        self.last_api_call[operation] = current_time
+        self.last_api_call[operation] = now_ns
         return True
     
     def record_api_call(self, operation: str, duration: float) -> None:
@@ -196,6 +321,10 @@ class PerformanceOptimizer:
             'timestamp': time.time()
         })
     
+    def count_api_call(self) -> None:
+        """Count one REST request; its duration is recorded by the caller's timer."""
+        self.api_call_count += 1
+    
     def add_to_batch(self, order_data: Dict[str, Any]) -> None:
         """Add order to batch processing queue.
         
@@ -218,10 +347,32 @@ class PerformanceOptimizer:
     
     def clear_cache(self) -> None:
         """Clear all caches."""
-        self.price_cache.clear()
-        self.order_book_cache.clear()
+        self.market_cache.clear()
+        self.ttl_cache.clear()
         self.logger.debug("Performance optimizer caches cleared")
     
+    def evict_expired(self) -> int:
+        """Drop only cache entries that can no longer be served.
+        
+        Iterates over snapshots of the caches, since I/O-pool threads (e.g.
+        background ticker refreshes) may insert while the sweep runs.
+        
+        Returns:
+            Number of entries evicted
+        """
+        now = time.monotonic()
+        expired = [
+            symbol for symbol, entry in list(self.market_cache.items())
+            if now - entry.price_ts >= self.price_cache_stale_ttl
+            and now - entry.order_book_ts >= self.order_book_cache_ttl
+        ]
+        for symbol in expired:
+            self.market_cache.pop(symbol, None)
+        expired_keys = [key for key, entry in list(self.ttl_cache.items()) if now >= entry['expires']]
+        for key in expired_keys:
+            self.ttl_cache.pop(key, None)
+        return len(expired) + len(expired_keys)
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics.
         
@@ -235,24 +386,25 @@ class PerformanceOptimizer:
             'slow_operations': []
         }
         
-        # Calculate operation averages
-        for operation, times in self.operation_times.items():
-            if times:
-                stats['operation_averages'][operation] = {
-                    'mean': np.mean(times),
-                    'median': np.median(times),
-                    'max': np.max(times),
-                    'min': np.min(times),
-                    'count': len(times)
-                }
-        
-        # Identify slow operations
-        for operation, times in self.operation_times.items():
-            if times and np.mean(times) > self._get_threshold(operation):
+        # Calculate operation averages and identify slow operations
+        for operation, timings in self.operation_times.items():
+            times = timings.values()
+            if not times.size:
+                continue
+            mean = times.mean()
+            stats['operation_averages'][operation] = {
+                'mean': mean,
+                'median': np.median(times),
+                'max': times.max(),
+                'min': times.min(),
+                'count': times.size
+            }
+            threshold = self._get_threshold(operation)
+            if mean > threshold:
                 stats['slow_operations'].append({
                     'operation': operation,
-                    'avg_time': np.mean(times),
-                    'threshold': self._get_threshold(operation)
+                    'avg_time': mean,
+                    'threshold': threshold
                 })
         
         return stats
@@ -320,7 +472,7 @@ class PerformanceOptimizer:
             )
         
         # Check cache effectiveness
-        if len(self.price_cache) == 0:
+        if not any(entry.price is not None for entry in self.market_cache.values()):
             recommendations.append(
                 "Price cache is empty - consider enabling caching for better performance"
             )
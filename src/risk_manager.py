@@ -1,11 +1,25 @@
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+import numpy as np
 from config import ConfigManager
 from logger import MarketMakerLogger
 
 class RiskManager:
     """Manages risk controls and trading limits."""
     
+    __slots__ = (
+        'config', 'logger', 'risk_config', 'trading_paused', 'pause_reason',
+        'current_inventory', 'current_pnl', 'daily_trades', '_day_bucket',
+        '_max_inventory', '_max_volatility', '_margin_buffer', '_max_drawdown', '_max_trades_per_day',
+        '_summary_template'
+    )
+    
+    # Violation messages; only formatted on the (rare) failing path
+    _INVENTORY_MSG = "Inventory {v:.4f} exceeds limit {lim:.4f}"
+    _VOLATILITY_MSG = "Volatility {v:.4f} exceeds limit {lim}"
+    _MARGIN_MSG = "Insufficient margin: {available} < {required}"
+    _TRADE_LIMIT_MSG = "Daily trade limit reached: {trades}/{lim}"
+    
     def __init__(self, config: ConfigManager, logger: MarketMakerLogger):
         """Initialize risk manager.
         
@@ -16,6 +30,7 @@ class RiskManager:
         self.config = config
         self.logger = logger
         self.risk_config = config.get_risk_config()
+        self._load_limits()
         self.trading_paused = False
         self.pause_reason = ""
         
@@ -23,10 +38,33 @@ class RiskManager:
         self.current_inventory = 0.0
         self.current_pnl = 0.0
         self.daily_trades = 0
-        self.last_reset_date = None
+        self._day_bucket = int(time.time()) // 86400  # UTC day index of daily_trades
         
+    def _load_limits(self) -> None:
+        """Cache risk limits as plain attributes for the per-cycle checks."""
+        risk_config = self.risk_config
+        self._max_inventory = float(risk_config.get('max_inventory', 10.0))
+        self._max_volatility = float(risk_config.get('max_volatility', 0.24))
+        self._margin_buffer = float(risk_config.get('margin_buffer', 2.0))
+        self._max_drawdown = float(risk_config.get('max_drawdown', 0.1))
+        self._max_trades_per_day = self.config.get_trading_config().get('trades_per_day', 500)  # Increased from 100 to 500
+        # Static part of get_risk_summary; only changes with the config
+        self._summary_template = {
+            'max_inventory': self._max_inventory,
+            'max_volatility': self._max_volatility,
+            'margin_buffer': self._margin_buffer
+        }
+    
+    def reload_config(self) -> None:
+        """Re-read risk limits after the configuration has changed."""
+        self.risk_config = self.config.get_risk_config()
+        self._load_limits()
+    
     def _safe_abs(self, value) -> float:
         """Safely compute abs() only for numeric types, else return 0.0 and log a warning."""
+        t = type(value)
+        if t is float or t is int:
+            return -value if value < 0 else value
         if isinstance(value, (int, float)):
             return abs(value)
         self.logger.warning(f"Tried to call abs() on non-numeric type: {type(value)}, value: {value}")
@@ -34,7 +72,7 @@ class RiskManager:
     
     def _safe_fmt(self, value, fmt=".4f"):
         """Safely format a value as a float if possible, else return str and log a warning."""
-        if isinstance(value, (int, float)):
+        if type(value) is float or isinstance(value, (int, float)):
             return format(value, fmt)
         self.logger.warning(f"Tried to format non-numeric type: {type(value)}, value: {value}")
         return str(value)
@@ -51,11 +89,12 @@ class RiskManager:
         if not isinstance(inventory, (int, float)):
             self.logger.warning(f"Non-numeric inventory passed to check_inventory_limits: {type(inventory)}, value: {inventory}")
             inventory = 0.0
-        max_inventory = self.risk_config.get('max_inventory', 10.0)
+        max_inventory = self._max_inventory
         
-        if self._safe_abs(inventory) > max_inventory:
-            reason = f"Inventory {self._safe_fmt(inventory)} exceeds limit {self._safe_fmt(max_inventory)}"
-            return False, reason
+        # inventory is numeric past the guard above, so test the sign inline
+        inv_abs = -inventory if inventory < 0.0 else inventory
+        if inv_abs > max_inventory:
+            return False, self._INVENTORY_MSG.format(v=inventory, lim=max_inventory)
         
         return True, ""
     
@@ -68,11 +107,10 @@ class RiskManager:
         Returns:
             Tuple of (is_safe, reason)
         """
-        max_volatility = self.risk_config.get('max_volatility', 0.24)
+        max_volatility = self._max_volatility
         
         if volatility > max_volatility:
-            reason = f"Volatility {volatility:.4f} exceeds limit {max_volatility}"
-            return False, reason
+            return False, self._VOLATILITY_MSG.format(v=volatility, lim=max_volatility)
         
         return True, ""
     
@@ -87,7 +125,8 @@ class RiskManager:
             Tuple of (is_safe, reason)
         """
         try:
-            # Calculate total margin used
+            # Calculate total margin used (a single-asset book holds only a
+            # handful of positions, so a plain loop beats any array setup)
             total_margin = 0.0
             for position in positions:
                 size = position.get('size', 0)
@@ -100,20 +139,21 @@ class RiskManager:
                     if not isinstance(notional, (int, float)) or not isinstance(leverage, (int, float)):
                         self.logger.warning(f"Non-numeric notional/leverage in margin check: notional={notional}, leverage={leverage}")
                         continue
-                    margin = self._safe_abs(notional / leverage)
-                    total_margin += margin
+                    # Both operands were type-checked above, so test the sign inline
+                    margin = notional / leverage
+                    total_margin += -margin if margin < 0.0 else margin
             
             # Get available balance (assuming USDC)
-            available_balance = balance.get('USDC', {}).get('free', 0.0)
-            margin_buffer = self.risk_config.get('margin_buffer', 2.0)
+            usdc = balance.get('USDC')
+            available_balance = usdc.get('free', 0.0) if usdc else 0.0
+            margin_buffer = self._margin_buffer
             
             # Check if we have enough margin buffer
             if total_margin * margin_buffer > available_balance:
-                reason = (
-                    f"Insufficient margin: {self._safe_fmt(available_balance)} < "
-                    f"{self._safe_fmt(total_margin * margin_buffer)}"
+                return False, self._MARGIN_MSG.format(
+                    available=self._safe_fmt(available_balance),
+                    required=self._safe_fmt(total_margin * margin_buffer)
                 )
-                return False, reason
             
             return True, ""
             
@@ -127,12 +167,10 @@ class RiskManager:
         Returns:
             Tuple of (is_safe, reason)
         """
-        trading_config = self.config.get_trading_config()
-        max_trades = trading_config.get('trades_per_day', 500)  # Increased from 100 to 500
+        max_trades = self._max_trades_per_day
         
         if self.daily_trades >= max_trades:
-            reason = f"Daily trade limit reached: {self.daily_trades}/{max_trades}"
-            return False, reason
+            return False, self._TRADE_LIMIT_MSG.format(trades=self.daily_trades, lim=max_trades)
         
         return True, ""
     
@@ -143,7 +181,7 @@ class RiskManager:
             inventory: New inventory size
         """
         self.current_inventory = inventory
-        self.logger.debug(f"Updated inventory: {inventory:.4f}")
+        self.logger.debug("Updated inventory: %.4f", inventory)
     
     def update_pnl(self, pnl: float) -> None:
         """Update current PnL tracking.
@@ -152,21 +190,20 @@ class RiskManager:
             pnl: New PnL value
         """
         self.current_pnl = pnl
-        self.logger.debug(f"Updated PnL: {pnl:.4f}")
+        self.logger.debug("Updated PnL: %.4f", pnl)
     
     def increment_trade_count(self) -> None:
         """Increment daily trade counter."""
         self.daily_trades += 1
-        self.logger.debug(f"Trade count: {self.daily_trades}")
+        self.logger.debug("Trade count: %d", self.daily_trades)
     
     def reset_daily_metrics(self) -> None:
         """Reset daily trading metrics."""
-        from datetime import datetime
-        
-        current_date = datetime.now().date()
-        if self.last_reset_date != current_date:
+        # Integer UTC day bucket; far cheaper than building datetime/date objects
+        day_bucket = int(time.time()) // 86400
+        if day_bucket != self._day_bucket:
             self.daily_trades = 0
-            self.last_reset_date = current_date
+            self._day_bucket = day_bucket
             self.logger.info("Reset daily trading metrics")
     
     def pause_trading(self, reason: str) -> None:
@@ -175,12 +212,16 @@ class RiskManager:
         Args:
             reason: Reason for pausing
         """
+        if self.trading_paused and reason == self.pause_reason:
+            return  # Already paused for the same reason; don't re-log every tick
         self.trading_paused = True
         self.pause_reason = reason
-        self.logger.warning(f"Trading paused: {reason}")
+        self.logger.warning("Trading paused: %s", reason)
     
     def resume_trading(self) -> None:
         """Resume trading after risk conditions improve."""
+        if not self.trading_paused:
+            return
         self.trading_paused = False
         self.pause_reason = ""
         self.logger.info("Trading resumed")
@@ -207,7 +248,7 @@ class RiskManager:
         Returns:
             Maximum position size
         """
-        return self.risk_config.get('max_inventory', 10.0)
+        return self._max_inventory
     
     def get_max_drawdown(self) -> float:
         """Get maximum allowed drawdown.
@@ -215,56 +256,100 @@ class RiskManager:
         Returns:
             Maximum drawdown as a decimal (e.g., 0.1 for 10%)
         """
-        return self.risk_config.get('max_drawdown', 0.1)
+        return self._max_drawdown
     
     def comprehensive_risk_check(self, inventory: float, volatility: float, 
-                               balance: Dict, positions: List[Dict]) -> Tuple[bool, List[str]]:
+                               balance: Dict, positions: List[Dict],
+                               fail_fast: bool = False) -> Tuple[bool, Sequence[str]]:
         """Perform comprehensive risk check.
         
+        Checks run cheapest first: daily trade limit, inventory, volatility,
+        then margin (which walks every position).
+        
         Args:
             inventory: Current inventory
             volatility: Current volatility
             balance: Account balance
             positions: Current positions
+            fail_fast: Stop at the first violation instead of collecting all
             
         Returns:
-            Tuple of (is_safe, list_of_violations)
+            Tuple of (is_safe, violations); violations is an empty tuple when safe
         """
-        violations = []
+        # Only materialized on the first failure; the common path allocates nothing
+        violations = None
         
         # Reset daily metrics if needed
         self.reset_daily_metrics()
         
-        # Check inventory limits
-        inventory_safe, inventory_reason = self.check_inventory_limits(inventory)
-        if not inventory_safe:
-            violations.append(inventory_reason)
+        # The cheap checks are inlined (same logic and messages as the
+        # public check_* methods) to skip a call and a result tuple each
+        
+        # Check daily trade limit
+        max_trades = self._max_trades_per_day
+        if self.daily_trades >= max_trades:
+            violations = [self._TRADE_LIMIT_MSG.format(trades=self.daily_trades, lim=max_trades)]
+        
+        # Check inventory limits (anything but a plain float takes the full
+        # check for its type warning and coercion)
+        if not (fail_fast and violations):
+            inventory_reason = None
+            if type(inventory) is float:
+                max_inventory = self._max_inventory
+                if (-inventory if inventory < 0.0 else inventory) > max_inventory:
+                    inventory_reason = self._INVENTORY_MSG.format(v=inventory, lim=max_inventory)
+            else:
+                inventory_safe, inventory_reason = self.check_inventory_limits(inventory)
+                if inventory_safe:
+                    inventory_reason = None
+            if inventory_reason is not None:
+                if violations is None:
+                    violations = []
+                violations.append(inventory_reason)
         
         # Check volatility limits
-        volatility_safe, volatility_reason = self.check_volatility_limits(volatility)
-        if not volatility_safe:
-            violations.append(volatility_reason)
+        if not (fail_fast and violations):
+            max_volatility = self._max_volatility
+            if volatility > max_volatility:
+                if violations is None:
+                    violations = []
+                violations.append(self._VOLATILITY_MSG.format(v=volatility, lim=max_volatility))
         
         # Check margin requirements
-        margin_safe, margin_reason = self.check_margin_requirements(balance, positions)
-        if not margin_safe:
-            violations.append(margin_reason)
-        
-        # Check daily trade limit
-        trade_limit_safe, trade_limit_reason = self.check_daily_trade_limit()
-        if not trade_limit_safe:
-            violations.append(trade_limit_reason)
+        if not (fail_fast and violations):
+            margin_safe, margin_reason = self.check_margin_requirements(balance, positions)
+            if not margin_safe:
+                if violations is None:
+                    violations = []
+                violations.append(margin_reason)
         
         # Update tracking
         self.update_inventory(inventory)
         
         # Determine if trading should be paused
-        if violations:
-            self.pause_trading("; ".join(violations))
-        else:
+        if violations is None:
             self.resume_trading()
+            return True, ()
+        
+        self.pause_trading("; ".join(violations))
+        return False, violations
+    
+    def batch_risk_check(self, inventories: np.ndarray, volatilities: np.ndarray) -> np.ndarray:
+        """Vectorized inventory/volatility limit check for replay and backtests.
         
-        return len(violations) == 0, violations
+        Unlike comprehensive_risk_check this has no side effects: it does not
+        update inventory tracking or pause trading.
+        
+        Args:
+            inventories: Inventory size per tick
+            volatilities: Volatility per tick
+            
+        Returns:
+            Boolean mask, True where both limits are respected
+        """
+        inventories = np.asarray(inventories, dtype=np.float64)
+        volatilities = np.asarray(volatilities, dtype=np.float64)
+        return (np.abs(inventories) <= self._max_inventory) & (volatilities <= self._max_volatility)
     
     def get_risk_summary(self) -> Dict[str, any]:
         """Get current risk metrics summary.
@@ -272,13 +357,10 @@ class RiskManager:
         Returns:
             Dictionary of risk metrics
         """
-        return {
-            'trading_paused': self.trading_paused,
-            'pause_reason': self.pause_reason,
-            'current_inventory': self.current_inventory,
-            'current_pnl': self.current_pnl,
-            'daily_trades': self.daily_trades,
-            'max_inventory': self.risk_config.get('max_inventory', 10.0),
-            'max_volatility': self.risk_config.get('max_volatility', 0.24),
-            'margin_buffer': self.risk_config.get('margin_buffer', 2.0)
-        } 
\ No newline at end of file
+        summary = self._summary_template.copy()
+        summary['trading_paused'] = self.trading_paused
+        summary['pause_reason'] = self.pause_reason
+        summary['current_inventory'] = self.current_inventory
+        summary['current_pnl'] = self.current_pnl
+        summary['daily_trades'] = self.daily_trades
+        return summary 
\ No newline at end of file
@@ -1,15 +1,71 @@
 import time
-import threading
+from decimal import Decimal
+import logging
 from typing import Dict, List, Optional, Tuple, Any
+import numpy as np
 from config import ConfigManager
-from exchange import HyperliquidExchange
+from exchange import HyperliquidExchange, NotConnectedError
 from volatility import VolatilityCalculator
 from risk_manager import RiskManager
 from logger import MarketMakerLogger
 
+def _aggressive_spread_core(base_spread: float, volatility: float, aggression_mult: float,
+                            min_spread: float, max_spread: float, no_fills: bool,
+                            volume_progress: float) -> Tuple[float, float]:
+    """Pure spread arithmetic behind calculate_aggressive_spread.
+    
+    Args:
+        base_spread: Configured base spread
+        volatility: Current volatility measure
+        aggression_mult: Spread multiplier from the aggression factor
+            (1 - spread_aggression * 0.5)
+        min_spread: Lower bound applied before the fill/volume adjustments
+        max_spread: Upper bound applied before the fill/volume adjustments
+        no_fills: Whether recent cycles went without fills
+        volume_progress: Daily volume as a fraction of the target
+        
+    Returns:
+        Tuple of (aggressive_spread, volatility-adjusted base spread)
+    """
+    # Adjust based on volatility (reduce spread in low volatility)
+    if volatility < 0.01:  # Low volatility
+        base_spread *= 0.7  # Reduce spread by 30%
+    elif volatility > 0.02:  # High volatility
+        base_spread *= 1.2  # Increase spread by 20%
+    
+    # Apply aggression factor, then keep within bounds
+    spread = base_spread * aggression_mult
+    spread = max(min_spread, min(spread, max_spread))
+    
+    if no_fills:
+        spread *= 0.8  # Reduce spread if not getting fills
+    
+    # Adjust based on volume targets
+    if volume_progress < 0.3:  # Behind on volume
+        spread *= 0.9  # More aggressive
+    elif volume_progress > 0.8:  # Ahead on volume
+        spread *= 1.1  # Less aggressive
+    
+    return spread, base_spread
+
+
 class MarketMakingStrategy:
     """Implements the long spot, short perps market making strategy with enhanced volume generation."""
     
+    __slots__ = (
+        'config', 'exchange', 'volatility_calc', 'risk_manager', 'logger',
+        'asset_config', 'fees_config', 'volatility_config', 'volume_config',
+        '_atr_period', '_timeframe', '_default_funding_rate',
+        'spot_symbol', 'perp_symbol', '_base_currency', '_tick_size', '_tick_decimals',
+        'base_spread', 'inventory_size', 'leverage',
+        'min_spread', 'max_spread', 'spread_aggression', 'order_tiers', 'tier_spacing',
+        'min_order_size', 'max_order_size', 'requote_tolerance', 'max_quote_age',
+        '_tier_factors', '_aggression_mult', '_half_base_spread',
+        'daily_volume', '_last_volume_reset_day', 'target_daily_volume', 'volume_boost_factor',
+        'current_inventory', 'current_spot_orders', '_tier_quotes', 'current_perp_orders',
+        '_positions_by_symbol', 'last_mid_price', 'last_trade_time', 'consecutive_no_fills'
+    )
+    
     def __init__(self, config: ConfigManager, exchange: HyperliquidExchange, 
                  volatility_calc: VolatilityCalculator, risk_manager: RiskManager,
                  logger: MarketMakerLogger):
@@ -36,10 +92,16 @@ class MarketMakingStrategy:
         self.fees_config = config.get_fees_config()
         self.volatility_config = config.get_volatility_config()
         self.volume_config = config.get_volume_config()
+        self._atr_period = self.volatility_config.get('atr_period', 14)
+        self._timeframe = self.volatility_config.get('timeframe', '1h')
+        self._default_funding_rate = config.get('funding_rate_annual', 0.08) / 365  # Daily, used if the fetch fails
         
         # Strategy state - will be set after market discovery
         self.spot_symbol = None
         self.perp_symbol = None
+        self._base_currency = None  # e.g. SOL from SOL/USDC, derived after discovery
+        self._tick_size = None  # Spot price tick size, if the market reports one
+        self._tick_decimals = 0  # Decimal places of _tick_size, for cleaning snapped prices
         self.base_spread = self.asset_config['base_spread']
         self.inventory_size = self.asset_config['inventory_size']
         self.leverage = self.asset_config['leverage']
@@ -52,17 +114,26 @@ class MarketMakingStrategy:
         self.tier_spacing = self.volume_config.get('tier_spacing', 0.0002)  # Spread between tiers (0.02%)
         self.min_order_size = self.volume_config.get('min_order_size', 0.5)  # Minimum order size in SOL
         self.max_order_size = self.volume_config.get('max_order_size', 5.0)  # Maximum order size in SOL
+        self.requote_tolerance = self.volume_config.get('requote_tolerance', 0.0001)  # Keep a tier's orders if prices moved less than this fraction
+        self.max_quote_age = self.volume_config.get('max_quote_age', 10.0)  # Replace every tier at least this often (seconds)
+        # Share of the base size per tier, closest to mid first (40% / 35% / 25%)
+        self._tier_factors = np.array([0.4, 0.35, 0.25])
+        # Loop-invariant factors derived from the config above
+        self._aggression_mult = 1 - self.spread_aggression * 0.5
+        self._half_base_spread = self.base_spread / 2
         
         # Volume tracking
         self.daily_volume = 0.0
-        self.last_volume_reset = None
+        self._last_volume_reset_day = None  # UTC day index of daily_volume
         self.target_daily_volume = self.volume_config.get('target_daily_volume', 1000.0)  # Target daily volume in SOL
         self.volume_boost_factor = 1.0  # Dynamic volume boost based on performance
         
         # Current state
         self.current_inventory = 0.0
-        self.current_spot_orders = []
+        self.current_spot_orders = set()  # IDs of live spot quotes
+        self._tier_quotes = {}  # tier -> (bid, ask, size, (bid_id, ask_id), placed_at monotonic)
         self.current_perp_orders = []
+        self._positions_by_symbol = {}  # Last fetched positions, keyed by symbol
         self.last_mid_price = 0.0
         self.last_trade_time = 0.0
         self.consecutive_no_fills = 0
@@ -93,16 +164,45 @@ class MarketMakingStrategy:
             # Fallback to config-based symbols
             self.spot_symbol = self.asset_config['symbol']
             self.perp_symbol = self.exchange.get_symbol_for_perp(self.spot_symbol)
+        
+        self._base_currency = self.spot_symbol.split('/')[0]
+        self._tick_size = self._load_tick_size()
+        if self._tick_size:
+            self._tick_decimals = max(0, -Decimal(repr(self._tick_size)).normalize().as_tuple().exponent)
+    
+    def _load_tick_size(self) -> Optional[float]:
+        """Read the spot market's price tick size (ccxt TICK_SIZE precision).
+        
+        Returns:
+            Tick size, or None if the market does not report a usable one
+        """
+        try:
+            market = self.exchange.get_market_info(self.spot_symbol)
+            tick = market['precision']['price'] if market else None
+            if isinstance(tick, (int, float)) and tick > 0:
+                return float(tick)
+        except Exception as e:
+            self.logger.log_error(e, "Loading tick size")
+        return None
     
     def reset_daily_volume(self) -> None:
         """Reset daily volume tracking."""
-        from datetime import datetime
-        current_date = datetime.now().date()
-        if self.last_volume_reset != current_date:
+        day = int(time.time()) // 86400
+        if day != self._last_volume_reset_day:
             self.daily_volume = 0.0
-            self.last_volume_reset = current_date
+            self._last_volume_reset_day = day
             self.logger.info(f"Reset daily volume tracking. Target: {self.target_daily_volume} SOL")
     
+    @property
+    def atr_period(self) -> int:
+        """ATR period used for spread adjustment."""
+        return self._atr_period
+    
+    @property
+    def timeframe(self) -> str:
+        """Candle timeframe used for volatility calculations."""
+        return self._timeframe
+    
     def calculate_aggressive_spread(self, mid_price: float, volatility: float) -> float:
         """Calculate aggressive spread for higher fill rates.
         
@@ -114,48 +214,34 @@ class MarketMakingStrategy:
             Aggressive spread as decimal
         """
         try:
-            # Calculate ATR for spread adjustment
-            atr = self.volatility_calc.calculate_atr(
-                self.spot_symbol,
-                self.volatility_config.get('atr_period', 14),
-                self.volatility_config.get('timeframe', '1h')
-            )
-            
-            # Base spread with volatility adjustment
-            base_spread = self.base_spread
-            
-            # Adjust based on volatility (reduce spread in low volatility)
-            if volatility < 0.01:  # Low volatility
-                base_spread *= 0.7  # Reduce spread by 30%
-            elif volatility > 0.02:  # High volatility
-                base_spread *= 1.2  # Increase spread by 20%
-            
-            # Apply aggression factor
-            aggressive_spread = base_spread * (1 - self.spread_aggression * 0.5)
-            
-            # Ensure spread is within bounds
-            aggressive_spread = max(self.min_spread, min(aggressive_spread, self.max_spread))
-            
-            # Adjust based on fill rate
-            if self.consecutive_no_fills > 5:
-                aggressive_spread *= 0.8  # Reduce spread if not getting fills
-                self.consecutive_no_fills = 0
-            
-            # Adjust based on volume targets
-            volume_progress = self.daily_volume / self.target_daily_volume
-            if volume_progress < 0.3:  # Behind on volume
-                aggressive_spread *= 0.9  # More aggressive
-            elif volume_progress > 0.8:  # Ahead on volume
-                aggressive_spread *= 1.1  # Less aggressive
-            
-            self.logger.debug(f"Aggressive spread: {aggressive_spread:.6f} (base: {base_spread:.6f}, vol: {volatility:.4f})")
-            
-            return aggressive_spread
-            
+            return self._calculate_aggressive_spread_impl(mid_price, volatility)
         except Exception as e:
             self.logger.log_error(e, "Aggressive spread calculation")
             return self.base_spread
     
+    def _calculate_aggressive_spread_impl(self, mid_price: float, volatility: float) -> float:
+        """Fast path of calculate_aggressive_spread; exceptions are handled by the caller."""
+        # Calculate ATR for spread adjustment
+        atr = self.volatility_calc.calculate_atr(
+            self.spot_symbol,
+            self._atr_period,
+            self._timeframe
+        )
+        
+        # Adjust based on fill rate (the counter restarts once applied)
+        no_fills = self.consecutive_no_fills > 5
+        if no_fills:
+            self.consecutive_no_fills = 0
+        
+        aggressive_spread, base_spread = _aggressive_spread_core(
+            self.base_spread, volatility, self._aggression_mult, self.min_spread, self.max_spread,
+            no_fills, self.daily_volume / self.target_daily_volume
+        )
+        
+        self.logger.debug("Aggressive spread: %.6f (base: %.6f, vol: %.4f)", aggressive_spread, base_spread, volatility)
+        
+        return aggressive_spread
+    
     def calculate_order_sizes(self, base_size: float) -> List[float]:
         """Calculate order sizes for multiple tiers.
         
@@ -165,19 +251,12 @@ class MarketMakingStrategy:
         Returns:
             List of order sizes for each tier
         """
-        sizes = []
-        for i in range(self.order_tiers):
-            # Tier 1: 40% of base size (closest to mid)
-            # Tier 2: 35% of base size
-            # Tier 3: 25% of base size (furthest from mid)
-            tier_factor = [0.4, 0.35, 0.25][i]
-            size = base_size * tier_factor
-            
-            # Ensure minimum and maximum sizes
-            size = max(self.min_order_size, min(size, self.max_order_size))
-            sizes.append(size)
-        
-        return sizes
+        return self._tier_sizes(base_size).tolist()
+    
+    def _tier_sizes(self, base_size: float) -> np.ndarray:
+        """Order size per tier, clipped to the configured min/max order size."""
+        return np.clip(base_size * self._tier_factors[:self.order_tiers],
+                       self.min_order_size, self.max_order_size)
     
     def calculate_quotes(self, mid_price: float, volatility: float) -> List[Tuple[float, float, float]]:
         """Calculate multiple tiers of bid and ask prices for better fill rates.
@@ -190,52 +269,62 @@ class MarketMakingStrategy:
             List of (bid_price, ask_price, order_size) tuples for each tier
         """
         try:
-            # Calculate aggressive spread
-            spread = self.calculate_aggressive_spread(mid_price, volatility)
-            
-            # Calculate base order size
-            base_order_size = self.inventory_size / (2 * self.order_tiers)
-            
-            # Calculate order sizes for each tier
-            order_sizes = self.calculate_order_sizes(base_order_size)
-            
-            quotes = []
-            for i, order_size in enumerate(order_sizes):
-                # Calculate tier-specific spread
-                tier_spread = spread + (i * self.tier_spacing)
-                
-                # Calculate bid and ask prices for this tier
-                spread_half = tier_spread / 2
-                bid_price = mid_price * (1 - spread_half)
-                ask_price = mid_price * (1 + spread_half)
-                
-                quotes.append((bid_price, ask_price, order_size))
-                
-                self.logger.debug(f"Tier {i+1}: Bid={bid_price:.4f}, Ask={ask_price:.4f}, Size={order_size:.2f}")
-            
-            self.logger.log_quote(self.spot_symbol, quotes[0][0], quotes[0][1], spread)
-            
-            return quotes
-            
+            return self._calculate_quotes_impl(mid_price, volatility)
         except Exception as e:
             self.logger.log_error(e, "Quote calculation")
             # Fallback to single tier
-            spread_half = self.base_spread / 2
+            spread_half = self._half_base_spread
             bid_price = mid_price * (1 - spread_half)
             ask_price = mid_price * (1 + spread_half)
             return [(bid_price, ask_price, self.inventory_size / 2)]
     
-    def get_current_inventory(self) -> float:
+    def _calculate_quotes_impl(self, mid_price: float, volatility: float) -> List[Tuple[float, float, float]]:
+        """Fast path of calculate_quotes; exceptions are handled by the caller."""
+        # Calculate aggressive spread
+        spread = self.calculate_aggressive_spread(mid_price, volatility)
+        
+        # Calculate base order size
+        base_order_size = self.inventory_size / (2 * self.order_tiers)
+        
+        # All tiers at once: each tier widens the spread by tier_spacing
+        order_sizes = self._tier_sizes(base_order_size)
+        spread_half = (spread + np.arange(order_sizes.size) * self.tier_spacing) / 2
+        bids = mid_price * (1 - spread_half)
+        asks = mid_price * (1 + spread_half)
+        tick = self._tick_size
+        if tick:
+            # Snap to whole ticks, rounding away from mid so the quoted spread
+            # never narrows. The tick counts are rounded to 1e-9 first so a
+            # price already on a tick (0.29 / 0.01 == 28.999999999999996)
+            # stays there, and the products are rounded to the tick's
+            # decimals to drop float residue.
+            decimals = self._tick_decimals
+            bids = np.round(np.floor(np.round(bids / tick, 9)) * tick, decimals)
+            asks = np.round(np.ceil(np.round(asks / tick, 9)) * tick, decimals)
+        quotes = list(zip(bids.tolist(), asks.tolist(), order_sizes.tolist()))
+        
+        if self.logger.logger.isEnabledFor(logging.DEBUG):
+            for i, (bid_price, ask_price, order_size) in enumerate(quotes):
+                self.logger.debug("Tier %d: Bid=%.4f, Ask=%.4f, Size=%.2f", i + 1, bid_price, ask_price, order_size)
+        
+        self.logger.log_quote(self.spot_symbol, quotes[0][0], quotes[0][1], spread)
+        
+        return quotes
+    
+    def get_current_inventory(self, snapshot: Optional[Dict[str, Any]] = None) -> float:
         """Get current spot inventory.
         
+        Args:
+            snapshot: Cycle snapshot from exchange.snapshot(); the balance is
+                fetched if not given
+        
         Returns:
             Current inventory size (positive for long, negative for short)
         """
         try:
-            balance = self.exchange.get_balance()
+            balance = snapshot['balance'] if snapshot is not None else self.exchange.get_balance()
             if balance:
-                # Extract base currency (e.g., SOL from SOL/USDC)
-                base_currency = self.spot_symbol.split('/')[0]
+                base_currency = self._base_currency
                 if base_currency in balance:
                     inventory = balance[base_currency]['free']
                     self.current_inventory = inventory
@@ -247,18 +336,26 @@ class MarketMakingStrategy:
             self.logger.log_error(e, "Getting current inventory")
             return self.current_inventory
     
-    def get_current_perp_position(self) -> float:
+    def _index_positions(self, positions: Optional[List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """Index positions by symbol once so lookups don't rescan the list."""
+        self._positions_by_symbol = {p.get('symbol'): p for p in positions} if positions else {}
+        return self._positions_by_symbol
+    
+    def get_current_perp_position(self, snapshot: Optional[Dict[str, Any]] = None) -> float:
         """Get current perpetual position size.
         
+        Args:
+            snapshot: Cycle snapshot from exchange.snapshot(); positions are
+                fetched if not given
+        
         Returns:
             Current perp position size (negative for short)
         """
         try:
-            positions = self.exchange.get_positions()
-            if positions:
-                for position in positions:
-                    if position.get('symbol') == self.perp_symbol:
-                        return position.get('size', 0.0)
+            positions = snapshot['positions'] if snapshot is not None else self.exchange.get_positions()
+            position = self._index_positions(positions).get(self.perp_symbol)
+            if position:
+                return position.get('size', 0.0)
             
             return 0.0
             
@@ -283,41 +380,92 @@ class MarketMakingStrategy:
     def place_spot_quotes(self, quotes: List[Tuple[float, float, float]]) -> List[str]:
         """Place multiple tiers of spot market making quotes.
         
+        Tiers whose prices moved by no more than ``requote_tolerance`` (as a
+        fraction of price) and whose size is unchanged keep their resting
+        orders; only the other tiers are cancelled and replaced. A tier is
+        only kept while both of its orders are still open, and every tier is
+        replaced at least every ``max_quote_age`` seconds.
+        
+        Any other open spot order on the symbol (left over from a failed
+        cancel or an unconfirmed placement) is cancelled along with the
+        replaced tiers. Orders whose cancel fails stay tracked so the next
+        cycle, or cancel_spot_orders, retries them.
+        
         Args:
             quotes: List of (bid_price, ask_price, order_size) tuples
             
         Returns:
-            List of order IDs
+            List of live order IDs (kept and newly placed)
         """
         order_ids = []
         
         try:
-            # Cancel existing spot orders
-            self.cancel_spot_orders()
-            
-            # Place orders for each tier
-            for i, (bid_price, ask_price, order_size) in enumerate(quotes):
-                # Place bid order
-                if order_size > 0:
-                    bid_order_id = self.exchange.place_order(
-                        self.spot_symbol, 'buy', order_size, bid_price, 'limit', 'spot'
-                    )
-                    if bid_order_id:
-                        order_ids.append(bid_order_id)
-                        self.current_spot_orders.append(bid_order_id)
-                        self.logger.debug(f"Placed tier {i+1} bid: {order_size:.2f} @ {bid_price:.4f}")
-                
-                # Place ask order
+            now = time.monotonic()
+            tolerance = self.requote_tolerance
+            max_age = self.max_quote_age
+            tier_quotes = self._tier_quotes
+            tracked = self.current_spot_orders
+            spot_symbol = self.spot_symbol
+            
+            # What is actually resting on the book (cached briefly by the exchange);
+            # None if the fetch failed, in which case no tier can be kept
+            open_orders = self.exchange.get_open_orders(spot_symbol, 'spot')
+            open_ids = None
+            if open_orders is not None:
+                open_ids = {o.get('id') for o in open_orders if o.get('id')}
+                tracked.clear()
+                tracked.update(open_ids)
+            
+            kept_ids = set()
+            new_tiers = []
+            for tier, (bid_price, ask_price, order_size) in enumerate(quotes):
+                prev = tier_quotes.get(tier)
+                if prev is not None:
+                    prev_bid, prev_ask, prev_size, prev_ids, placed_at = prev
+                    if (open_ids is not None and order_size == prev_size and now - placed_at < max_age
+                            and prev_ids[0] in open_ids and prev_ids[1] in open_ids
+                            and abs(bid_price - prev_bid) <= tolerance * bid_price
+                            and abs(ask_price - prev_ask) <= tolerance * ask_price):
+                        kept_ids.update(prev_ids)
+                        order_ids.extend(prev_ids)
+                        continue
+                    del tier_quotes[tier]
                 if order_size > 0:
-                    ask_order_id = self.exchange.place_order(
-                        self.spot_symbol, 'sell', order_size, ask_price, 'limit', 'spot'
-                    )
-                    if ask_order_id:
-                        order_ids.append(ask_order_id)
-                        self.current_spot_orders.append(ask_order_id)
-                        self.logger.debug(f"Placed tier {i+1} ask: {order_size:.2f} @ {ask_price:.4f}")
-            
-            self.logger.info(f"Placed {len(order_ids)} spot orders across {len(quotes)} tiers")
+                    new_tiers.append((tier, bid_price, ask_price, order_size))
+            
+            # Tiers no longer quoted (e.g. fewer tiers this cycle)
+            for tier in [t for t in tier_quotes if t >= len(quotes)]:
+                del tier_quotes[tier]
+            
+            # Everything live that is not part of a kept tier goes
+            stale_ids = [oid for oid in (open_ids if open_ids is not None else tracked)
+                         if oid not in kept_ids]
+            if stale_ids:
+                if self.exchange.cancel_orders(stale_ids, spot_symbol, 'spot'):
+                    tracked.difference_update(stale_ids)
+                else:
+                    self.logger.warning(f"Failed to cancel {len(stale_ids)} stale spot orders; retrying next cycle")
+            
+            # Submit the changed tiers' bids and asks in one batched request
+            orders = []
+            for _, bid_price, ask_price, order_size in new_tiers:
+                orders.append({'symbol': spot_symbol, 'side': 'buy', 'amount': order_size, 'price': bid_price})
+                orders.append({'symbol': spot_symbol, 'side': 'sell', 'amount': order_size, 'price': ask_price})
+            
+            placed = self.exchange.place_orders(orders, 'spot') if orders else []
+            placed_ids = [oid for oid in placed if oid]
+            order_ids.extend(placed_ids)
+            tracked.update(placed_ids)
+            if len(placed) == len(orders):
+                for k, (tier, bid_price, ask_price, order_size) in enumerate(new_tiers):
+                    tier_quotes[tier] = (bid_price, ask_price, order_size, (placed[2 * k], placed[2 * k + 1]), now)
+            elif orders:
+                # Ids can't be matched to tiers; they are tracked, and next
+                # cycle cancels them with any other untiered open order
+                self.logger.warning(f"Batch placement returned {len(placed)} results for {len(orders)} orders")
+            
+            self.logger.info(f"Placed {len(placed_ids)} spot orders across {len(quotes)} tiers "
+                             f"({len(quotes) - len(new_tiers)} tiers unchanged)")
             
         except Exception as e:
             self.logger.log_error(e, "Placing spot quotes")
@@ -335,16 +483,16 @@ class MarketMakingStrategy:
             Order ID if placed, None otherwise
         """
         try:
-            self.logger.debug(f"[DEBUG] Raw current_perp_size type: {type(current_perp_size)}, value: {current_perp_size}")
+            self.logger.debug("[DEBUG] Raw current_perp_size type: %s, value: %s", type(current_perp_size), current_perp_size)
             current_perp_size = self._normalize_position_size(current_perp_size)
-            self.logger.debug(f"[DEBUG] Normalized current_perp_size type: {type(current_perp_size)}, value: {current_perp_size}")
+            self.logger.debug("[DEBUG] Normalized current_perp_size type: %s, value: %s", type(current_perp_size), current_perp_size)
             # Calculate required adjustment
             adjustment = hedge_size - current_perp_size
-            self.logger.debug(f"[DEBUG] Adjustment type: {type(adjustment)}, value: {adjustment}")
+            self.logger.debug("[DEBUG] Adjustment type: %s, value: %s", type(adjustment), adjustment)
             if not isinstance(adjustment, (int, float)):
                 self.logger.warning(f"Unexpected type for adjustment in hedge order: {type(adjustment)}")
                 adjustment = 0.0
-            self.logger.debug(f"[DEBUG] About to call abs() on adjustment type: {type(adjustment)}, value: {adjustment}")
+            self.logger.debug("[DEBUG] About to call abs() on adjustment type: %s, value: %s", type(adjustment), adjustment)
             if abs(adjustment) < 0.01:  # Small adjustment threshold
                 return None
             # Get current perp price
@@ -367,8 +515,12 @@ class MarketMakingStrategy:
     def cancel_spot_orders(self) -> None:
         """Cancel all current spot orders."""
         try:
-            for order_id in self.current_spot_orders:
-                self.exchange.cancel_order(order_id, self.spot_symbol, 'spot')
+            self._tier_quotes.clear()
+            if self.current_spot_orders:
+                if not self.exchange.cancel_orders(list(self.current_spot_orders), self.spot_symbol, 'spot'):
+                    # Keep them tracked so the next call retries
+                    self.logger.warning(f"Failed to cancel {len(self.current_spot_orders)} spot orders")
+                    return
             
             self.current_spot_orders.clear()
             self.logger.info("Cancelled all spot orders")
@@ -378,6 +530,8 @@ class MarketMakingStrategy:
     
     def _normalize_position_size(self, perp_position: Any) -> float:
         """Utility to ensure perp_position is always a float."""
+        if type(perp_position) is float:
+            return perp_position  # Already normalized (the common case)
         if isinstance(perp_position, dict):
             return perp_position.get('size', 0.0)
         elif isinstance(perp_position, list):
@@ -391,21 +545,24 @@ class MarketMakingStrategy:
             self.logger.warning(f"Unexpected type for perp_position: {type(perp_position)}")
             return 0.0
     
-    def calculate_funding_income(self, perp_position: float, funding_rate: float) -> float:
+    def calculate_funding_income(self, perp_position: float, funding_rate: float,
+                                 snapshot: Optional[Dict[str, Any]] = None) -> float:
         """Calculate daily funding income.
         
         Args:
             perp_position: Current perp position size (negative for short)
             funding_rate: Current funding rate
+            snapshot: Cycle snapshot from exchange.snapshot(); the spot ticker
+                is fetched if not given
         
         Returns:
             Daily funding income
         """
         try:
-            self.logger.debug(f"[DEBUG] Raw perp_position type: {type(perp_position)}, value: {perp_position}")
-            self.logger.debug(f"[DEBUG] Raw funding_rate type: {type(funding_rate)}, value: {funding_rate}")
+            self.logger.debug("[DEBUG] Raw perp_position type: %s, value: %s", type(perp_position), perp_position)
+            self.logger.debug("[DEBUG] Raw funding_rate type: %s, value: %s", type(funding_rate), funding_rate)
             perp_position = self._normalize_position_size(perp_position)
-            self.logger.debug(f"[DEBUG] Normalized perp_position type: {type(perp_position)}, value: {perp_position}")
+            self.logger.debug("[DEBUG] Normalized perp_position type: %s, value: %s", type(perp_position), perp_position)
             # Defensive: ensure funding_rate is a float
             if not isinstance(funding_rate, (int, float)):
                 self.logger.warning(f"Unexpected type for funding_rate in funding income: {type(funding_rate)}")
@@ -413,11 +570,14 @@ class MarketMakingStrategy:
             # Log values for debugging
             self.logger.info(f"Calculating funding income: perp_position={perp_position}, funding_rate={funding_rate}")
             # Get current price for calculation
-            ticker = self.exchange.get_ticker(self.spot_symbol)
+            if snapshot is not None:
+                ticker = (snapshot['tickers'] or {}).get(self.spot_symbol)
+            else:
+                ticker = self.exchange.get_ticker(self.spot_symbol)
             if not ticker:
                 return 0.0
             current_price = ticker['last']
-            self.logger.debug(f"[DEBUG] About to call abs() on perp_position type: {type(perp_position)}, value: {perp_position}")
+            self.logger.debug("[DEBUG] About to call abs() on perp_position type: %s, value: %s", type(perp_position), perp_position)
             # Calculate funding income (positive for short positions when funding rate is positive)
             funding_income = abs(perp_position) * current_price * funding_rate
             return funding_income
@@ -443,135 +603,125 @@ class MarketMakingStrategy:
             if time.time() - self.last_trade_time > 300:  # 5 minutes
                 self.consecutive_no_fills += 1
     
-    def execute_strategy_cycle(self) -> Dict[str, any]:
-        """Execute one complete strategy cycle with enhanced volume generation."""
+    def execute_strategy_cycle(self, volatility: Optional[float] = None) -> Dict[str, any]:
+        """Execute one complete strategy cycle with enhanced volume generation.
+        
+        Args:
+            volatility: Volatility already measured for this cycle; computed
+                here if not given
+        """
         try:
-            step_times = {}
-            t0 = time.time()
-            
-            # Reset daily volume tracking
-            self.reset_daily_volume()
-            
-            # Concurrently fetch ticker, balance, and positions
-            ticker_result = {}
-            balance_result = {}
-            positions_result = {}
-            
-            def fetch_ticker():
-                ticker_result['value'] = self.exchange.get_ticker(self.spot_symbol)
-            def fetch_balance():
-                balance_result['value'] = self.exchange.get_balance()
-            def fetch_positions():
-                positions_result['value'] = self.exchange.get_positions()
-            
-            threads = [
-                threading.Thread(target=fetch_ticker),
-                threading.Thread(target=fetch_balance),
-                threading.Thread(target=fetch_positions)
-            ]
-            
-            for th in threads:
-                th.start()
-            for th in threads:
-                th.join()
-            
-            step_times['fetch_ticker_balance_positions'] = time.time() - t0
-            
-            ticker = ticker_result.get('value')
-            if not ticker:
-                return {'success': False, 'error': 'Unable to get ticker'}
-            
-            mid_price = ticker['last']
-            self.last_mid_price = mid_price
-            # Extract numeric spot inventory from balance dict
-            balance = balance_result.get('value')
-            spot_inventory = 0.0
-            if balance and isinstance(balance, dict):
-                base_currency = self.spot_symbol.split('/')[0]
-                if base_currency in balance and isinstance(balance[base_currency], dict):
-                    spot_inventory = balance[base_currency].get('free', 0.0)
-            positions = positions_result.get('value')
-            perp_position = 0.0
-            if positions:
-                for position in positions:
-                    if position.get('symbol') == self.perp_symbol:
-                        perp_position = position.get('size', 0.0)
-                        break
-            perp_position = self._normalize_position_size(perp_position)
-            # Additional logging for debugging
-            self.logger.debug(f"[DEBUG] Pre-funding: perp_position type={type(perp_position)}, value={perp_position}")
-            t1 = time.time()
+            return self._execute_strategy_cycle_impl(volatility)
+        except NotConnectedError as e:
+            # Flagged so the caller can reconnect instead of retrying blindly
+            self.logger.warning(f"Strategy cycle skipped: {e}")
+            return {'success': False, 'error': str(e), 'disconnected': True}
+        except Exception as e:
+            self.logger.log_error(e, "Strategy cycle execution")
+            return {'success': False, 'error': str(e)}
+    
+    def _execute_strategy_cycle_impl(self, volatility: Optional[float]) -> Dict[str, any]:
+        """Fast path of execute_strategy_cycle; exceptions are handled by the caller."""
+        step_times = {}
+        t0 = time.time()
+        
+        # Reset daily volume tracking
+        self.reset_daily_volume()
+        
+        # Fetch tickers (spot plus perp, so the hedge leg hits the cache),
+        # balance, positions and funding concurrently on the exchange's
+        # persistent I/O pool
+        spot_symbol = self.spot_symbol
+        logger = self.logger
+        snapshot = self.exchange.snapshot(spot_symbol, self.perp_symbol)
+        
+        step_times['fetch_ticker_balance_positions'] = time.time() - t0
+        
+        ticker = (snapshot['tickers'] or {}).get(spot_symbol)
+        if not ticker:
+            return {'success': False, 'error': 'Unable to get ticker'}
+        
+        mid_price = ticker['last']
+        self.last_mid_price = mid_price
+        # Extract numeric spot inventory from balance dict
+        balance = snapshot['balance']
+        spot_inventory = 0.0
+        if balance and isinstance(balance, dict):
+            base_currency = self._base_currency
+            if base_currency in balance and isinstance(balance[base_currency], dict):
+                spot_inventory = balance[base_currency].get('free', 0.0)
+        positions = snapshot['positions'] or []
+        perp_position = self._normalize_position_size(self.get_current_perp_position(snapshot))
+        # Additional logging for debugging
+        logger.debug("[DEBUG] Pre-funding: perp_position type=%s, value=%s", type(perp_position), perp_position)
+        t1 = time.time()
+        if volatility is None:
             volatility = self.volatility_calc.calculate_volatility(
-                self.spot_symbol,
-                self.volatility_config.get('atr_period', 14),
-                self.volatility_config.get('timeframe', '1h')
+                spot_symbol,
+                self._atr_period,
+                self._timeframe
             )
-            step_times['volatility'] = time.time() - t1
-            
-            t2 = time.time()
-            funding_rate = self.exchange.get_funding_rate(self.perp_symbol)
-            if funding_rate is None:
-                funding_rate = self.config.get('funding_rate_annual', 0.08) / 365
-            self.logger.debug(f"[DEBUG] Pre-funding: funding_rate type={type(funding_rate)}, value={funding_rate}")
-            funding_income = self.calculate_funding_income(perp_position, funding_rate)
-            self.logger.debug(f"[DEBUG] Post-funding: funding_income type={type(funding_income)}, value={funding_income}")
-            step_times['funding'] = time.time() - t2
-            
-            t3 = time.time()
-            positions = positions_result.get('value') or []
-            risk_safe, violations = self.risk_manager.comprehensive_risk_check(
-                spot_inventory, volatility, balance, positions
-            )
-            step_times['risk'] = time.time() - t3
-            
-            if not risk_safe:
-                self.cancel_spot_orders()
-                return {
-                    'success': False,
-                    'error': f"Risk violations: {', '.join(violations)}",
-                    'trading_paused': True
-                }
-            
-            t4 = time.time()
-            
-            # Calculate multiple tiers of quotes
-            quotes = self.calculate_quotes(mid_price, volatility)
-            
-            # Place spot quotes across multiple tiers
-            spot_order_ids = self.place_spot_quotes(quotes)
-            
-            # Calculate and place hedge
-            required_hedge = self.calculate_hedge_size(spot_inventory)
-            hedge_order_id = self.place_hedge_order(required_hedge, perp_position)
-            
-            # Update volume metrics
-            self.update_volume_metrics()
-            
-            self.risk_manager.increment_trade_count()
-            step_times['orders'] = time.time() - t4
-            
-            self.logger.info(f"Step timings: {step_times}")
-            
+        step_times['volatility'] = time.time() - t1
+        
+        t2 = time.time()
+        funding_rate = snapshot['funding_rate']
+        if funding_rate is None:
+            funding_rate = self._default_funding_rate
+        logger.debug("[DEBUG] Pre-funding: funding_rate type=%s, value=%s", type(funding_rate), funding_rate)
+        funding_income = self.calculate_funding_income(perp_position, funding_rate, snapshot)
+        logger.debug("[DEBUG] Post-funding: funding_income type=%s, value=%s", type(funding_income), funding_income)
+        step_times['funding'] = time.time() - t2
+        
+        t3 = time.time()
+        risk_safe, violations = self.risk_manager.comprehensive_risk_check(
+            spot_inventory, volatility, balance, positions
+        )
+        step_times['risk'] = time.time() - t3
+        
+        if not risk_safe:
+            self.cancel_spot_orders()
             return {
-                'success': True,
-                'mid_price': mid_price,
-                'quotes': len(quotes),
-                'spread': quotes[0][1] - quotes[0][0] if quotes else 0,
-                'volatility': volatility,
-                'spot_inventory': spot_inventory,
-                'perp_position': perp_position,
-                'funding_rate': funding_rate,
-                'funding_income': funding_income,
-                'spot_orders': len(spot_order_ids),
-                'hedge_order': hedge_order_id is not None,
-                'risk_safe': risk_safe,
-                'daily_volume': self.daily_volume,
-                'volume_progress': self.daily_volume / self.target_daily_volume
+                'success': False,
+                'error': f"Risk violations: {', '.join(violations)}",
+                'trading_paused': True
             }
-            
-        except Exception as e:
-            self.logger.log_error(e, "Strategy cycle execution")
-            return {'success': False, 'error': str(e)}
+        
+        t4 = time.time()
+        
+        # Calculate multiple tiers of quotes
+        quotes = self.calculate_quotes(mid_price, volatility)
+        
+        # Place spot quotes across multiple tiers
+        spot_order_ids = self.place_spot_quotes(quotes)
+        
+        # Calculate and place hedge
+        required_hedge = self.calculate_hedge_size(spot_inventory)
+        hedge_order_id = self.place_hedge_order(required_hedge, perp_position)
+        
+        # Update volume metrics
+        self.update_volume_metrics()
+        
+        self.risk_manager.increment_trade_count()
+        step_times['orders'] = time.time() - t4
+        
+        logger.info("Step timings: %s", step_times)
+        
+        return {
+            'success': True,
+            'mid_price': mid_price,
+            'quotes': len(quotes),
+            'spread': quotes[0][1] - quotes[0][0] if quotes else 0,
+            'volatility': volatility,
+            'spot_inventory': spot_inventory,
+            'perp_position': perp_position,
+            'funding_rate': funding_rate,
+            'funding_income': funding_income,
+            'spot_orders': len(spot_order_ids),
+            'hedge_order': hedge_order_id is not None,
+            'risk_safe': risk_safe,
+            'daily_volume': self.daily_volume,
+            'volume_progress': self.daily_volume / self.target_daily_volume
+        }
     
     def get_strategy_summary(self) -> Dict[str, any]:
         """Get current strategy summary.
@@ -5,6 +5,24 @@ import time
 from logger import MarketMakerLogger
 from config import ConfigManager
 
+
+def _atr_kernel(ohlcv: np.ndarray, period: int) -> float:
+    """Average True Range over the last ``period`` candles.
+    
+    Args:
+        ohlcv: Array of [timestamp, open, high, low, close, volume] rows
+        period: Number of periods to average
+        
+    Returns:
+        ATR value
+    """
+    high = ohlcv[1:, 2]
+    low = ohlcv[1:, 3]
+    prev_close = ohlcv[:-1, 4]
+    true_ranges = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return float(true_ranges[-period:].mean())
+
+
 class VolatilityCalculator:
     """Calculates volatility using ATR and adjusts spreads accordingly."""
     
@@ -110,7 +128,7 @@ class VolatilityCalculator:
             cache_key = f"{symbol}_{timeframe}_{period}"
             if cache_key in self.atr_cache:
                 cache_entry = self.atr_cache[cache_key]
-                if time.time() - cache_entry['timestamp'] < self.cache_ttl:
+                if time.time() - cache_entry['timestamp'] < cache_entry['ttl']:
                     self.cache_hits += 1
                     return cache_entry['data']
                 else:
@@ -138,22 +156,15 @@ class VolatilityCalculator:
                 self.logger.warning(f"Insufficient data for ATR calculation: {len(ohlcv) if ohlcv else 0} < {period + 1}")
                 return 0.0
             
-            # Calculate True Range for each period
-            true_ranges = []
-            for i in range(1, len(ohlcv)):
-                high = ohlcv[i][2]
-                low = ohlcv[i][3]
-                prev_close = ohlcv[i-1][4]
-                tr = self.calculate_true_range(high, low, prev_close)
-                true_ranges.append(tr)
-            
             # Calculate ATR as simple moving average of True Range
-            atr = np.mean(true_ranges[-period:])
+            atr = _atr_kernel(np.asarray(ohlcv, dtype=np.float64), period)
             
-            # Cache the result
+            # Cache the result; ATR moves with the candles, so keep it for
+            # one candle interval (never less than the general cache TTL)
             self.atr_cache[cache_key] = {
                 'data': atr,
-                'timestamp': time.time()
+                'timestamp': time.time(),
+                'ttl': max(self.cache_ttl, ccxt.Exchange.parse_timeframe(timeframe))
             }
             
             # Record calculation time
@@ -307,6 +318,24 @@ class VolatilityCalculator:
         self.ohlcv_cache.clear()
         self.logger.debug("Volatility calculator caches cleared")
     
+    def evict_expired(self) -> int:
+        """Drop only cache entries older than their TTL.
+        
+        Returns:
+            Number of entries evicted
+        """
+        now = time.time()
+        evicted = 0
+        for cache, ttl in ((self.atr_cache, self.cache_ttl),
+                           (self.volatility_cache, self.cache_ttl),
+                           (self.ohlcv_cache, self.ohlcv_cache_ttl)):
+            # Snapshot first: a prefetch in an executor thread may insert meanwhile
+            expired = [key for key, entry in list(cache.items()) if now - entry['timestamp'] >= entry.get('ttl', ttl)]
+            for key in expired:
+                cache.pop(key, None)
+            evicted += len(expired)
+        return evicted
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics.
         
@@ -199,6 +199,11 @@ def main():
         ('test_performance', 'Performance Optimizations'),
         ('test_integration', 'Integration'),
         ('test_strategy', 'Strategy'),
+        ('test_config', 'Config Reload'),
+        ('test_risk_manager', 'Risk Manager'),
+        ('test_exchange', 'Exchange'),
+        ('test_main', 'Main Loop'),
+        ('test_logger', 'Logger'),
         ('test_production_readiness', 'Production Readiness'),
         ('test_paper_trading', 'Paper Trading'),
         ('test_stress', 'Stress Testing')
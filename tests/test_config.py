@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import ConfigManager
+
+class TestConfigManagerReload(unittest.TestCase):
+    """Test cases for ConfigManager.maybe_reload."""
+    
+    # Credentials are injected from the environment on every (re)load
+    ENV = {
+        'HYPERLIQUID_API_WALLET': '0xapi',
+        'HYPERLIQUID_API_WALLET_PRIVATE': '0xkey',
+        'HYPERLIQUID_MAIN_WALLET': '0xmain'
+    }
+    
+    def setUp(self):
+        """Write a private copy of config.json to modify."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.tmp_dir, 'config.json')
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'config.json'), self.config_path)
+        with patch.dict(os.environ, self.ENV):
+            self.config = ConfigManager(self.config_path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_no_reload_when_unchanged(self):
+        """Test that an untouched file is not re-parsed."""
+        config_dict = self.config.config
+        
+        self.assertFalse(self.config.maybe_reload())
+        self.assertIs(self.config.config, config_dict)
+    
+    def test_reload_on_change(self):
+        """Test that an edited file is re-parsed and compiled lookups follow it."""
+        get_interval = self.config.compile_path('trading.update_interval')
+        with open(self.config_path) as f:
+            data = json.load(f)
+        data['trading']['update_interval'] = get_interval() + 100
+        with open(self.config_path, 'w') as f:
+            json.dump(data, f)
+        
+        with patch.dict(os.environ, self.ENV):
+            self.assertTrue(self.config.maybe_reload())
+            self.assertFalse(self.config.maybe_reload())
+        
+        self.assertEqual(self.config.get('trading.update_interval'), data['trading']['update_interval'])
+        self.assertEqual(get_interval(), data['trading']['update_interval'])
+        self.assertEqual(self.config.get_trading_config()['update_interval'], data['trading']['update_interval'])
+
+if __name__ == '__main__':
+    unittest.main()
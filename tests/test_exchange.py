@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+import ccxt
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from exchange import HyperliquidExchange
+from config import ConfigManager
+from logger import MarketMakerLogger
+
+class TestHyperliquidExchange(unittest.TestCase):
+    """Test cases for HyperliquidExchange (no network access)."""
+    
+    def setUp(self):
+        """Set up an exchange whose ccxt client is mocked."""
+        config_values = {
+            'exchange.name': 'hyperliquid',
+            'exchange.api_wallet': '0xapi',
+            'exchange.api_wallet_private': '0xkey',
+            'exchange.main_wallet': '0xmain'
+        }
+        self.mock_config = Mock(spec=ConfigManager)
+        self.mock_config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+        self.mock_logger = Mock(spec=MarketMakerLogger)
+        
+        self.exchange = HyperliquidExchange(self.mock_config, self.mock_logger)
+        self.exchange.exchange = Mock()
+        self.exchange.connected = True
+    
+    def tearDown(self):
+        self.exchange.close()
+    
+    def test_retry_retries_transient_errors_with_capped_backoff(self):
+        """Test that network errors are retried with exponential, capped delays."""
+        func = Mock(side_effect=[ccxt.NetworkError('reset'), ccxt.RequestTimeout('timeout'), 'ok'])
+        
+        with patch('exchange.time.sleep') as mock_sleep, patch('exchange.random.uniform', return_value=0.0):
+            result = self.exchange._retry_api_call(func, 'arg', max_retries=3, base_delay=0.2, max_delay=0.3)
+        
+        self.assertEqual(result, 'ok')
+        self.assertEqual(func.call_count, 3)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.2)
+        self.assertAlmostEqual(delays[1], 0.3)  # 0.4 capped at max_delay
+    
+    def test_retry_gives_up_after_max_retries(self):
+        """Test that the last transient error is raised once retries run out."""
+        func = Mock(side_effect=ccxt.RateLimitExceeded('slow down'))
+        
+        with patch('exchange.time.sleep'):
+            with self.assertRaises(ccxt.RateLimitExceeded):
+                self.exchange._retry_api_call(func, max_retries=3)
+        
+        self.assertEqual(func.call_count, 3)
+    
+    def test_retry_fails_fast_on_non_retryable_errors(self):
+        """Test that invalid orders and auth failures are raised immediately."""
+        for error in (ccxt.InvalidOrder('bad order'), ccxt.AuthenticationError('bad key')):
+            func = Mock(side_effect=error)
+            with patch('exchange.time.sleep') as mock_sleep:
+                with self.assertRaises(type(error)):
+                    self.exchange._retry_api_call(func)
+            self.assertEqual(func.call_count, 1)
+            mock_sleep.assert_not_called()
+    
+    def test_non_retryable_error_returns_immediately(self):
+        """Test that a public call returns None after a single failed attempt."""
+        self.exchange.exchange.fetch_balance.side_effect = ccxt.AuthenticationError('bad key')
+        
+        with patch('exchange.time.sleep') as mock_sleep:
+            balance = self.exchange.get_balance()
+        
+        self.assertIsNone(balance)
+        self.assertEqual(self.exchange.exchange.fetch_balance.call_count, 1)
+        mock_sleep.assert_not_called()
+    
+    def test_unknown_symbol_is_negatively_cached(self):
+        """Test that a failed market lookup is not retried until the miss expires."""
+        self.exchange.markets = {}
+        self.exchange.exchange.market.side_effect = ccxt.BadSymbol('unknown')
+        
+        self.assertIsNone(self.exchange.get_market_info('FOO/USDC'))
+        self.assertIsNone(self.exchange.get_market_info('FOO/USDC'))
+        self.assertEqual(self.exchange.exchange.market.call_count, 1)
+        
+        # Age the miss past its 60s TTL
+        self.exchange._market_miss_cache['FOO/USDC'] -= self.exchange._market_miss_ttl + 1
+        self.assertIsNone(self.exchange.get_market_info('FOO/USDC'))
+        self.assertEqual(self.exchange.exchange.market.call_count, 2)
+    
+    def _cache_ticker(self, symbol, ticker, age):
+        """Seed the price cache with a ticker fetched ``age`` seconds ago."""
+        optimizer = self.exchange.performance_optimizer
+        optimizer.cache_price_data(symbol, ticker)
+        optimizer.market_cache[symbol].price_ts -= age
+    
+    def test_stale_ticker_is_served_with_one_background_refresh(self):
+        """Test that a stale ticker is returned while a single refresh is scheduled."""
+        optimizer = self.exchange.performance_optimizer
+        self._cache_ticker('SOL/USDC', {'last': 1.0}, age=(optimizer.price_cache_ttl + optimizer.price_cache_stale_ttl) / 2)
+        
+        with patch.object(self.exchange, '_io_pool') as mock_pool:
+            first = self.exchange.get_tickers(['SOL/USDC'])
+            second = self.exchange.get_tickers(['SOL/USDC'])
+        
+        self.assertEqual(first, {'SOL/USDC': {'last': 1.0}})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_pool.submit.call_count, 1)
+        self.exchange.exchange.fetch_tickers.assert_not_called()
+    
+    def test_stale_ticker_is_refetched_when_stale_not_allowed(self):
+        """Test that allow_stale=False (as used by snapshot) fetches synchronously."""
+        optimizer = self.exchange.performance_optimizer
+        self._cache_ticker('SOL/USDC', {'last': 1.0}, age=(optimizer.price_cache_ttl + optimizer.price_cache_stale_ttl) / 2)
+        self.exchange.exchange.fetch_tickers.return_value = {'SOL/USDC': {'last': 2.0}}
+        
+        with patch.object(self.exchange, '_io_pool') as mock_pool:
+            tickers = self.exchange.get_tickers(['SOL/USDC'], allow_stale=False)
+        
+        self.assertEqual(tickers, {'SOL/USDC': {'last': 2.0}})
+        mock_pool.submit.assert_not_called()
+    
+    def test_ticker_past_stale_ttl_is_a_miss(self):
+        """Test that a ticker older than price_cache_stale_ttl is fetched again."""
+        optimizer = self.exchange.performance_optimizer
+        self._cache_ticker('SOL/USDC', {'last': 1.0}, age=optimizer.price_cache_stale_ttl + 1)
+        self.exchange.exchange.fetch_tickers.return_value = {'SOL/USDC': {'last': 2.0}}
+        
+        with patch.object(self.exchange, '_io_pool') as mock_pool:
+            tickers = self.exchange.get_tickers(['SOL/USDC'])
+        
+        self.assertEqual(tickers, {'SOL/USDC': {'last': 2.0}})
+        self.exchange.exchange.fetch_tickers.assert_called_once_with(['SOL/USDC'])
+        mock_pool.submit.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from logger import MarketMakerLogger
+
+class TestMarketMakerLogger(unittest.TestCase):
+    """Test cases for MarketMakerLogger's queue listener."""
+    
+    def setUp(self):
+        """Log into a scratch directory."""
+        self.log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.log_dir, ignore_errors=True)
+    
+    def _listener_threads(self):
+        """Return the running QueueListener threads."""
+        return [t for t in threading.enumerate()
+                if getattr(getattr(t, '_target', None), '__name__', None) == '_monitor']
+    
+    def test_recreated_logger_replaces_previous_listener(self):
+        """Test that a second logger stops the first listener and writes each record once."""
+        first = MarketMakerLogger(self.log_dir, "DEBUG")
+        second = MarketMakerLogger(self.log_dir, "DEBUG")
+        self.addCleanup(second.cleanup)
+        
+        self.assertEqual(len(self._listener_threads()), 1)
+        self.assertEqual(len(second.logger.handlers), 1)
+        
+        second.info("hello once")
+        first.cleanup()  # Stale instance must not tear down the active listener
+        second.info("still logging")
+        second.cleanup()
+        
+        with open(os.path.join(self.log_dir, 'market_maker.log'), encoding='utf-8') as f:
+            contents = f.read()
+        self.assertEqual(contents.count("hello once"), 1)
+        self.assertEqual(contents.count("still logging"), 1)
+        self.assertEqual(self._listener_threads(), [])
+
+if __name__ == '__main__':
+    unittest.main()
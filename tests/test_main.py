@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import MarketMaker
+from exchange import HyperliquidExchange, NotConnectedError
+from strategy import MarketMakingStrategy
+from logger import MarketMakerLogger
+
+class TestMarketMakerCycle(unittest.TestCase):
+    """Test cases for MarketMaker.run_single_cycle (no network access)."""
+    
+    def setUp(self):
+        """Set up a market maker around a strategy with a mocked exchange."""
+        with patch.object(MarketMaker, '_initialize_components'):
+            self.market_maker = MarketMaker()
+        self.mock_logger = Mock(spec=MarketMakerLogger)
+        self.mock_exchange = Mock(spec=HyperliquidExchange)
+        self.mock_exchange.exchange = Mock()
+        self.mock_exchange.find_solana_markets.return_value = ('SOL/USDC', 'SOL/USDC:USDC')
+        self.mock_exchange.get_market_info.return_value = None
+        
+        mock_config = Mock()
+        mock_config.get_asset_config.return_value = {
+            'symbol': 'SOL/USDC',
+            'inventory_size': 10.0,
+            'base_spread': 0.00245,
+            'leverage': 10.0
+        }
+        mock_config.get_fees_config.return_value = {}
+        mock_config.get_volatility_config.return_value = {'atr_period': 14, 'timeframe': '1h'}
+        mock_config.get_volume_config.return_value = {'spread_aggression': 0.8}
+        mock_config.get.return_value = 0.08
+        
+        self.market_maker.logger = self.mock_logger
+        self.market_maker.exchange = self.mock_exchange
+        self.market_maker.strategy = MarketMakingStrategy(
+            mock_config, self.mock_exchange, Mock(), Mock(), self.mock_logger
+        )
+    
+    def test_disconnected_cycle_triggers_reconnect(self):
+        """Test that NotConnectedError from the snapshot leads to a reconnect attempt."""
+        self.mock_exchange.snapshot.side_effect = NotConnectedError("Exchange not connected")
+        self.mock_exchange.connect.return_value = True
+        
+        success = self.market_maker.run_single_cycle(0.015)
+        
+        self.assertFalse(success)
+        self.mock_exchange.connect.assert_called_once_with()
+        self.mock_exchange.place_orders.assert_not_called()
+    
+    def test_failed_cycle_does_not_reconnect(self):
+        """Test that ordinary cycle failures do not touch the connection."""
+        self.mock_exchange.snapshot.return_value = {
+            'tickers': {}, 'balance': None, 'positions': None, 'funding_rate': None
+        }
+        
+        success = self.market_maker.run_single_cycle(0.015)
+        
+        self.assertFalse(success)
+        self.mock_exchange.connect.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from risk_manager import RiskManager
+from config import ConfigManager
+from logger import MarketMakerLogger
+
+class TestRiskManagerBatch(unittest.TestCase):
+    """Test cases for RiskManager.batch_risk_check."""
+    
+    def setUp(self):
+        """Set up a risk manager with known limits."""
+        self.mock_config = Mock(spec=ConfigManager)
+        self.mock_config.get_risk_config.return_value = {
+            'max_inventory': 10.0,
+            'max_volatility': 0.24
+        }
+        self.mock_config.get_trading_config.return_value = {}
+        self.risk = RiskManager(self.mock_config, Mock(spec=MarketMakerLogger))
+    
+    def test_batch_matches_scalar_checks_at_boundaries(self):
+        """Test that the vectorized mask agrees with the scalar checks at the limits."""
+        inventories = [0.0, 10.0, -10.0, 10.000001, -10.000001, 5.0, 5.0, 5.0]
+        volatilities = [0.0, 0.1, 0.1, 0.1, 0.1, 0.24, 0.240001, 1.0]
+        
+        mask = self.risk.batch_risk_check(np.array(inventories), np.array(volatilities))
+        
+        expected = [
+            self.risk.check_inventory_limits(inv)[0] and self.risk.check_volatility_limits(vol)[0]
+            for inv, vol in zip(inventories, volatilities)
+        ]
+        self.assertEqual(mask.tolist(), expected)
+        self.assertEqual(expected, [True, True, True, False, False, True, False, False])
+    
+    def test_batch_has_no_side_effects(self):
+        """Test that batch checks never pause trading or track inventory."""
+        self.risk.batch_risk_check([50.0], [5.0])
+        
+        self.assertFalse(self.risk.trading_paused)
+        self.assertEqual(self.risk.current_inventory, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from strategy import MarketMakingStrategy
+from exchange import NotConnectedError
 from config import ConfigManager
 from logger import MarketMakerLogger
 
@@ -33,6 +34,18 @@ class TestMarketMakingStrategy(unittest.TestCase):
             'timeframe': '1h',
             'spread_scale_factor': 0.5
         }
+        self.mock_config.get_volume_config.return_value = {
+            'target_daily_volume': 1000.0,
+            'min_spread': 0.0005,
+            'max_spread': 0.005,
+            'spread_aggression': 0.8,
+            'order_tiers': 3,
+            'tier_spacing': 0.0002,
+            'min_order_size': 0.5,
+            'max_order_size': 5.0,
+            'requote_tolerance': 0.0001,
+            'max_quote_age': 10
+        }
         self.mock_config.get.return_value = 0.08 / 365  # Default funding rate
         
         # Mock other components
@@ -127,6 +140,122 @@ class TestMarketMakingStrategy(unittest.TestCase):
         position = self.strategy.get_current_perp_position()
         
         self.assertEqual(position, -50.0)
+    
+    def test_execute_strategy_cycle_flags_disconnect(self):
+        """Test that a lost connection is reported as 'disconnected', not a generic failure."""
+        self.mock_exchange.snapshot.side_effect = NotConnectedError("Exchange not connected")
+        
+        result = self.strategy.execute_strategy_cycle(0.015)
+        
+        self.assertFalse(result['success'])
+        self.assertTrue(result['disconnected'])
+        self.mock_exchange.place_orders.assert_not_called()
+    
+    def _snapped_quotes(self, mid_price, tier_spacing=0.0):
+        """Quote around mid_price on a 0.01 tick with a zero base spread."""
+        self.strategy._tick_size = 0.01
+        self.strategy._tick_decimals = 2
+        self.strategy.tier_spacing = tier_spacing
+        with patch.object(MarketMakingStrategy, 'calculate_aggressive_spread', return_value=0.0):
+            return self.strategy.calculate_quotes(mid_price, 0.015)
+    
+    def test_calculate_quotes_keeps_on_tick_prices(self):
+        """Test that prices already on a tick are not moved a tick outward."""
+        for mid_price in (0.29, 143.21, 143.21000000000001, 1.15):
+            for bid_price, ask_price, _ in self._snapped_quotes(mid_price):
+                self.assertEqual(bid_price, round(mid_price, 2))
+                self.assertEqual(ask_price, round(mid_price, 2))
+    
+    def test_calculate_quotes_rounds_away_from_mid(self):
+        """Test that bids snap down and asks snap up to the tick."""
+        bid_price, ask_price, _ = self._snapped_quotes(143.215)[0]
+        
+        self.assertEqual(bid_price, 143.21)
+        self.assertEqual(ask_price, 143.22)
+    
+    def test_calculate_quotes_has_no_float_residue(self):
+        """Test that snapped prices are exact decimals of the tick."""
+        # 14292 * 0.01 == 142.92000000000002 without the final rounding
+        quotes = self._snapped_quotes(142.925) + self._snapped_quotes(142.937, tier_spacing=0.0007)
+        for bid_price, ask_price, _ in quotes:
+            for price in (bid_price, ask_price):
+                self.assertLessEqual(len(repr(price).split('.')[1]), 2)
+    
+    def _setup_quoting(self, open_ids):
+        """Configure the exchange mocks for place_spot_quotes."""
+        self.mock_exchange.get_open_orders.return_value = [{'id': oid} for oid in open_ids]
+        self.mock_exchange.cancel_orders.return_value = True
+        counter = iter(range(1, 1000))
+        self.mock_exchange.place_orders.side_effect = lambda orders, market_type='spot': [
+            f"o{next(counter)}" for _ in orders
+        ]
+    
+    def test_place_spot_quotes_keeps_unchanged_tiers(self):
+        """Test that tiers whose orders are open and prices unchanged are kept."""
+        quotes = [(142.9, 143.1, 1.0), (142.8, 143.2, 1.0)]
+        self._setup_quoting([])
+        first = self.strategy.place_spot_quotes(quotes)
+        self.assertEqual(first, ['o1', 'o2', 'o3', 'o4'])
+        
+        self.mock_exchange.reset_mock()
+        self.mock_exchange.get_open_orders.return_value = [{'id': oid} for oid in first]
+        second = self.strategy.place_spot_quotes(quotes)
+        
+        self.assertEqual(second, first)
+        self.mock_exchange.cancel_orders.assert_not_called()
+        self.mock_exchange.place_orders.assert_not_called()
+        self.assertEqual(self.strategy.current_spot_orders, set(first))
+    
+    def test_place_spot_quotes_replaces_moved_and_filled_tiers(self):
+        """Test that moved tiers and tiers with a filled side are replaced."""
+        self._setup_quoting([])
+        self.strategy.place_spot_quotes([(142.9, 143.1, 1.0), (142.8, 143.2, 1.0), (142.7, 143.3, 1.0)])
+        
+        # Tier 0 moved, tier 1's ask (o4) filled, tier 2 unchanged
+        self.mock_exchange.get_open_orders.return_value = [{'id': oid} for oid in ('o1', 'o2', 'o3', 'o5', 'o6')]
+        live = self.strategy.place_spot_quotes([(143.9, 144.1, 1.0), (142.8, 143.2, 1.0), (142.7, 143.3, 1.0)])
+        
+        cancelled = self.mock_exchange.cancel_orders.call_args[0][0]
+        self.assertEqual(sorted(cancelled), ['o1', 'o2', 'o3'])
+        self.assertEqual(len(self.mock_exchange.place_orders.call_args[0][0]), 4)
+        self.assertCountEqual(live, ['o5', 'o6', 'o7', 'o8', 'o9', 'o10'])
+        self.assertEqual(self.strategy.current_spot_orders, set(live))
+    
+    def test_place_spot_quotes_failed_cancel_keeps_orders_tracked(self):
+        """Test that orders whose cancel failed stay tracked and are retried."""
+        self._setup_quoting([])
+        self.strategy.place_spot_quotes([(142.9, 143.1, 1.0)])
+        
+        self.mock_exchange.get_open_orders.return_value = [{'id': 'o1'}, {'id': 'o2'}]
+        self.mock_exchange.cancel_orders.return_value = False
+        self.strategy.place_spot_quotes([(143.9, 144.1, 1.0)])
+        
+        self.assertTrue({'o1', 'o2', 'o3', 'o4'} <= self.strategy.current_spot_orders)
+        
+        # cancel_spot_orders retries them and keeps tracking on failure too
+        self.strategy.cancel_spot_orders()
+        self.assertIn('o1', self.mock_exchange.cancel_orders.call_args[0][0])
+        self.assertIn('o1', self.strategy.current_spot_orders)
+    
+    def test_place_spot_quotes_short_place_result(self):
+        """Test that ids from a short batch result are tracked and later cancelled."""
+        self._setup_quoting([])
+        self.mock_exchange.place_orders.side_effect = None
+        self.mock_exchange.place_orders.return_value = ['o1', None]
+        live = self.strategy.place_spot_quotes([(142.9, 143.1, 1.0), (142.8, 143.2, 1.0)])
+        
+        self.assertEqual(live, ['o1'])
+        self.assertEqual(self.strategy.current_spot_orders, {'o1'})
+        self.assertEqual(self.strategy._tier_quotes, {})
+        self.mock_logger.info.assert_called_with("Placed 1 spot orders across 2 tiers (0 tiers unchanged)")
+        
+        # Next cycle: o1 and an order whose placement was never confirmed are cancelled
+        self.mock_exchange.get_open_orders.return_value = [{'id': 'o1'}, {'id': 'x1'}]
+        self.mock_exchange.place_orders.return_value = ['o2', 'o3', 'o4', 'o5']
+        self.strategy.place_spot_quotes([(142.9, 143.1, 1.0), (142.8, 143.2, 1.0)])
+        
+        self.assertEqual(sorted(self.mock_exchange.cancel_orders.call_args[0][0]), ['o1', 'x1'])
+        self.assertEqual(self.strategy.current_spot_orders, {'o2', 'o3', 'o4', 'o5'})
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file